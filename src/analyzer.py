@@ -12,6 +12,11 @@ import logging
 from typing import Dict, List, Set, Tuple
 
 from models import (
+    LINK_BACKBONE,
+    LINK_PPPOE,
+    LINK_PTMP,
+    LINK_PTP,
+    LINK_UNKNOWN,
     Anomaly,
     Link,
     LinkType,
@@ -112,7 +117,7 @@ class NetworkAnalyzer:
                         )
                         links.append(link)
                         logger.info(
-                            f"Identified {link_type.value} link: "
+                            f"Identified {link_type} link: "
                             f"{router.identity} -> {neighbor_router.identity}"
                         )
                 else:
@@ -138,29 +143,25 @@ class NetworkAnalyzer:
             LinkType: Determined link type.
         """
         # Find the interface object
-        interface = None
-        for iface in source_router.interfaces:
-            if iface.name == interface_name:
-                interface = iface
-                break
+        interface = source_router.find_interface(interface_name)
 
         if not interface:
-            return LinkType.UNKNOWN
+            return LINK_UNKNOWN
 
         # Wireless interfaces
         if interface.type == "wlan" or "wlan" in interface.name.lower():
             if interface.mode == "station":
-                return LinkType.PTP
+                return LINK_PTP
             elif interface.mode == "ap-bridge":
-                return LinkType.PTMP
+                return LINK_PTMP
             else:
-                return LinkType.PTP  # Default for wireless
+                return LINK_PTP  # Default for wireless
 
         # Ethernet interfaces connecting to known routers are likely backbone
         if dest_router and interface.type == "ether":
-            return LinkType.BACKBONE
+            return LINK_BACKBONE
 
-        return LinkType.UNKNOWN
+        return LINK_UNKNOWN
 
     def analyze_pppoe_links(self) -> List[Link]:
         """
@@ -178,7 +179,7 @@ class NetworkAnalyzer:
                     source_interface="pppoe-server",
                     destination_router=active_conn.name,  # Client username
                     destination_interface=active_conn.caller_id,  # Client MAC
-                    link_type=LinkType.PPPOE,
+                    link_type=LINK_PPPOE,
                     confidence=1.0,
                     notes=f"Active PPPoE: {active_conn.address}, uptime: {active_conn.uptime}",
                 )
@@ -415,10 +416,10 @@ class NetworkAnalyzer:
             "total_interfaces": sum(len(r.interfaces) for r in self.routers),
             "total_neighbors": sum(len(r.neighbors) for r in self.routers),
             "total_links": len(all_links),
-            "backbone_links": sum(1 for l in all_links if l.link_type == LinkType.BACKBONE),
-            "ptp_links": sum(1 for l in all_links if l.link_type == LinkType.PTP),
-            "ptmp_links": sum(1 for l in all_links if l.link_type == LinkType.PTMP),
-            "pppoe_connections": sum(1 for l in all_links if l.link_type == LinkType.PPPOE),
+            "backbone_links": sum(1 for l in all_links if l.link_type == LINK_BACKBONE),
+            "ptp_links": sum(1 for l in all_links if l.link_type == LINK_PTP),
+            "ptmp_links": sum(1 for l in all_links if l.link_type == LINK_PTMP),
+            "pppoe_connections": sum(1 for l in all_links if l.link_type == LINK_PPPOE),
             "total_anomalies": len(anomalies),
             "critical_anomalies": sum(1 for a in anomalies if a.severity == "critical"),
             "warning_anomalies": sum(1 for a in anomalies if a.severity == "warning"),
@@ -903,13 +903,10 @@ def configure_users_and_groups(config: Dict) -> Tuple[int, int]:
                 if client.connect():
                     logger.info(f"Connected to {host} for user management")
 
-                    # Configure Groups
-                    for group_conf in groups_config:
-                        client.ensure_user_group(group_conf)
-
-                    # Configure Users
-                    for user_conf in users_config:
-                        client.ensure_user(user_conf)
+                    # Configure Groups and Users: the batch entrypoints fetch
+                    # each table once instead of once per configured item
+                    client.ensure_user_groups(groups_config)
+                    client.ensure_users(users_config)
 
                     successful += 1
                     client.disconnect()
@@ -1471,6 +1468,10 @@ def main():
         logger.exception("Unexpected error occurred")
         console.print(f"\n[red]Error: {e}[/red]")
         sys.exit(1)
+    finally:
+        # Drain the warm-connection pools so pooled router sockets close cleanly
+        MikrotikClient.close_all()
+        SFTPClientManager.close_all()
 
 
 if __name__ == "__main__":
@@ -5,10 +5,16 @@ This module provides a client for connecting to Mikrotik routers via the RouterO
 and collecting network information including interfaces, neighbors, PPPoE data, and system info.
 """
 
+import functools
 import logging
-from typing import Dict, List, Optional, Tuple
+import operator
+import socket
+import threading
+import time
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 import routeros_api
+from routeros_api import exceptions as routeros_exceptions
 
 from models import (
     Interface,
@@ -31,6 +37,173 @@ from models import (
 
 logger = logging.getLogger(__name__)
 
+# RouterOS flags arrive as "true"/"false" or "yes"/"no" depending on the
+# resource; a single dict lookup decodes either spelling to a bool
+_BOOL = {"true": True, "yes": True, "false": False, "no": False}
+
+
+@functools.lru_cache(maxsize=1024)
+def _normalize_csv(value: str) -> frozenset:
+    """Split a comma-separated RouterOS list into a frozenset of tokens.
+
+    Cached because the same policy/address literals recur for every
+    group and user on every router; repeats cost one dict hit instead
+    of a split/strip pass per call.
+    """
+    return frozenset(filter(None, map(str.strip, value.split(","))))
+
+
+def _to_int(value) -> Optional[int]:
+    """Parse an optional RouterOS integer field ('' and None become None)."""
+    return int(value) if value else None
+
+
+def _row_id(row: Dict) -> Optional[str]:
+    """Return a row's internal id, trying '.id' (the key the API emits) first."""
+    return row.get(".id") or row.get("id")
+
+# Row-parsing fast paths for the bulk getters: each API row is merged over a
+# defaults dict and unpacked with a single itemgetter call instead of a chain
+# of per-field dict.get lookups. Matters on routers with thousands of rows.
+_IFACE_DEFAULTS = {
+    "name": "",
+    "type": "unknown",
+    "mtu": None,
+    "mac-address": None,
+    "disabled": "false",
+    "running": "false",
+    "comment": None,
+}
+_IFACE_GET = operator.itemgetter(*_IFACE_DEFAULTS)
+
+_PPPOE_ACTIVE_DEFAULTS = {
+    "name": "",
+    "service": None,
+    "caller-id": "",
+    "address": "",
+    "uptime": "0s",
+    "encoding": None,
+}
+_PPPOE_ACTIVE_GET = operator.itemgetter(*_PPPOE_ACTIVE_DEFAULTS)
+
+_PPPOE_SECRET_DEFAULTS = {
+    "name": "",
+    "password": None,
+    "service": None,
+    "profile": "default",
+    "local-address": None,
+    "remote-address": None,
+    "disabled": "false",
+    "comment": None,
+}
+_PPPOE_SECRET_GET = operator.itemgetter(*_PPPOE_SECRET_DEFAULTS)
+
+_IP_ADDRESS_DEFAULTS = {
+    "address": "",
+    "network": "",
+    "interface": "",
+    "disabled": "false",
+    "comment": None,
+}
+_IP_ADDRESS_GET = operator.itemgetter(*_IP_ADDRESS_DEFAULTS)
+
+_NEIGHBOR_DEFAULTS = {
+    "interface": "",
+    "identity": "unknown",
+    "address": None,
+    "platform": None,
+    "version": None,
+    "mac-address": None,
+}
+_NEIGHBOR_GET = operator.itemgetter(*_NEIGHBOR_DEFAULTS)
+
+_SCHEDULER_DEFAULTS = {
+    "name": "",
+    "start-date": None,
+    "start-time": None,
+    "interval": None,
+    "on-event": None,
+    "policy": None,
+    "disabled": "false",
+    "run-count": None,
+    "next-run": None,
+}
+_SCHEDULER_GET = operator.itemgetter(*_SCHEDULER_DEFAULTS)
+
+# Minimal field lists requested via '.proplist' for each collected resource;
+# shared by the single getters and the pipelined batch in collect_all_data
+_SYSTEM_RESOURCE_PROPS = [
+    "uptime",
+    "version",
+    "cpu",
+    "cpu-load",
+    "free-memory",
+    "total-memory",
+    "architecture-name",
+    "board-name",
+]
+_IFACE_PROPS = ["name", "type", "mtu", "mac-address", "disabled", "running", "comment"]
+_WIRELESS_PROPS = ["name", "ssid", "mode", "frequency"]
+_IP_ADDRESS_PROPS = ["address", "network", "interface", "disabled", "comment"]
+_NEIGHBOR_PROPS = ["interface", "identity", "address", "platform", "version", "mac-address"]
+_PPPOE_ACTIVE_PROPS = ["name", "service", "caller-id", "address", "uptime", "encoding"]
+_PPPOE_SECRET_PROPS = [
+    "name",
+    "password",
+    "service",
+    "profile",
+    "local-address",
+    "remote-address",
+    "disabled",
+    "comment",
+]
+_SCHEDULER_PROPS = [
+    "name",
+    "start-date",
+    "start-time",
+    "interval",
+    "on-event",
+    "policy",
+    "disabled",
+    "run-count",
+    "next-run",
+]
+
+# Warm RouterOS connections keyed by (host, port, username). Fleet passes
+# reconnect to the same routers over and over; reusing the authenticated
+# RouterOsApiPool skips a TCP handshake and a login exchange per visit.
+_CONNECTION_POOL: Dict[Tuple[str, int, str], "routeros_api.RouterOsApiPool"] = {}
+_CONNECTION_POOL_LOCK = threading.Lock()
+_CONNECTION_POOL_MAX = 32
+
+# Escapes double quotes for values embedded in RouterOS script literals;
+# str.translate scans the string once in C instead of per-char replace
+_QUOTE_ESCAPE = str.maketrans({'"': '\\"'})
+
+# Whether a host has wireless interfaces at all, keyed by host. Hardware
+# does not change between passes, so once a router is known to be wired-only
+# every later collection skips the /interface/wireless round-trip.
+_WIRELESS_CAPS: Dict[str, bool] = {}
+
+# How long one /file fetch may serve both the backup and RSC listings
+_FILE_CACHE_TTL = 2.0  # seconds
+
+# File suffixes the listing helpers care about; the cached /file fetch is
+# bucketed by these in a single pass
+_FILE_SUFFIXES = (".backup", ".rsc")
+
+# Default collection options for collect_all_data - collect everything
+_DEFAULT_COLLECTION_OPTIONS = {
+    "system_info": True,
+    "interfaces": True,
+    "ip_addresses": True,
+    "neighbors": True,
+    "pppoe_active": True,
+    "pppoe_secrets": True,
+    "wireless": True,
+    "schedulers": False,  # Optional: disabled by default
+}
+
 
 class MikrotikClient:
     """
@@ -60,6 +233,10 @@ class MikrotikClient:
         self.timeout = timeout
         self.connection = None
         self.api = None
+        self._identity_cache: Optional[str] = None
+        self._resource_cache: Optional[SystemResource] = None
+        self._file_cache: Optional[Tuple[float, Dict[str, List[str]]]] = None
+        self._resources: Dict[str, object] = {}
 
     def connect(self) -> bool:
         """
@@ -68,10 +245,40 @@ class MikrotikClient:
         Returns:
             bool: True if connection successful, False otherwise.
         """
+        # Reuse a warm, already-authenticated connection when one is pooled
+        # for this router. A pooled socket may have died while idle (router
+        # reboot, NAT timeout between fleet passes), so reuse pays one cheap
+        # identity probe, which also warms the per-connection identity
+        # cache; if the probe fails, discard the stale connection and fall
+        # through to a fresh dial (mirrors the SSH pool in sftp_client)
+        pool_key = (self.host, self.port, self.username)
+        with _CONNECTION_POOL_LOCK:
+            pooled = _CONNECTION_POOL.pop(pool_key, None)
+        if pooled is not None:
+            try:
+                self.connection = pooled
+                self.api = pooled.get_api()
+                self._resources = {}
+                test_result = self._resource("/system/identity").get()
+                self._identity_cache = (
+                    test_result[0].get("name") if test_result else None
+                )
+                logger.info("Reusing pooled connection to %s:%d", self.host, self.port)
+                return True
+            except Exception as e:
+                logger.debug(f"Pooled connection to {self.host} unusable, redialing: {e}")
+                try:
+                    pooled.disconnect()
+                except Exception:
+                    pass
+                self.connection = None
+                self.api = None
+                self._identity_cache = None
+                self._resources = {}
+
         try:
             logger.info(f"Connecting to {self.host}:{self.port}...")
 
-            # Create connection pool
             self.connection = routeros_api.RouterOsApiPool(
                 host=self.host,
                 username=self.username,
@@ -82,13 +289,32 @@ class MikrotikClient:
 
             # Get API connection
             self.api = self.connection.get_api()
-
-            # Test the connection with a simple command
-            identity = self.api.get_resource("/system/identity")
-            test_result = identity.get()
-            logger.info(
-                f"Successfully connected to {self.host} (router: {test_result[0].get('name', 'unknown')})"
-            )
+            self._resources = {}
+
+            # Tune the API socket: the protocol exchanges many small
+            # sentences, so disable Nagle, and enable keepalive so half-open
+            # links surface before the application timeout. routeros_api
+            # hands us a SocketWrapper; the real socket (plain or SSL) sits
+            # on its .socket attribute. Only OS-level refusals are treated
+            # as best-effort.
+            sock = getattr(self.connection.socket, "socket", None)
+            if sock is None:
+                logger.warning(
+                    "No underlying socket exposed for %s; skipping socket tuning",
+                    self.host,
+                )
+            else:
+                try:
+                    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+                    if hasattr(socket, "TCP_KEEPIDLE"):
+                        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 30)
+                        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 10)
+                        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 3)
+                except OSError as e:
+                    logger.debug(f"Could not tune API socket options for {self.host}: {e}")
+
+            logger.info("Connected to %s:%d", self.host, self.port)
             return True
 
         except Exception as e:
@@ -100,19 +326,73 @@ class MikrotikClient:
                     pass
             self.connection = None
             self.api = None
+            self._identity_cache = None
+            self._resource_cache = None
+            self._resources = {}
             return False
 
     def disconnect(self) -> None:
-        """Close the connection to the router."""
+        """Return the connection to the pool, or close it if the pool is full."""
         if self.connection:
+            pool_key = (self.host, self.port, self.username)
+            pooled = False
+            with _CONNECTION_POOL_LOCK:
+                if (
+                    pool_key not in _CONNECTION_POOL
+                    and len(_CONNECTION_POOL) < _CONNECTION_POOL_MAX
+                ):
+                    _CONNECTION_POOL[pool_key] = self.connection
+                    pooled = True
+
             try:
-                self.connection.disconnect()
-                logger.info(f"Disconnected from {self.host}")
+                if pooled:
+                    logger.info(f"Returned connection to {self.host} to the pool")
+                else:
+                    self.connection.disconnect()
+                    logger.info(f"Disconnected from {self.host}")
             except Exception as e:
                 logger.warning(f"Error disconnecting from {self.host}: {e}")
             finally:
                 self.connection = None
                 self.api = None
+                self._identity_cache = None
+                self._resource_cache = None
+                self._file_cache = None
+                self._resources = {}
+
+    @classmethod
+    def close_all(cls) -> None:
+        """Close every pooled warm connection; call once at process shutdown."""
+        with _CONNECTION_POOL_LOCK:
+            pooled = list(_CONNECTION_POOL.values())
+            _CONNECTION_POOL.clear()
+        for connection in pooled:
+            try:
+                connection.disconnect()
+            except Exception as e:
+                logger.warning(f"Error closing pooled connection: {e}")
+        if pooled:
+            logger.info(f"Closed {len(pooled)} pooled connections")
+
+    def _resource(self, path: str):
+        """
+        Return the resource proxy for an API path, cached per connection.
+
+        get_resource builds a fresh proxy object on every call while the hot
+        paths keep asking for the same handful of paths; reusing the proxies
+        for the lifetime of the connection avoids that churn. The cache is
+        cleared whenever the connection is (re)established or torn down.
+
+        Parameters:
+            path (str): API path (e.g., '/interface').
+
+        Returns:
+            The routeros_api resource object for the path.
+        """
+        resource = self._resources.get(path)
+        if resource is None:
+            resource = self._resources[path] = self.api.get_resource(path)
+        return resource
 
     def get_identity(self) -> Optional[str]:
         """
@@ -124,7 +404,7 @@ class MikrotikClient:
         if not self.api:
             return None
         try:
-            identity_resource = self.api.get_resource("/system/identity")
+            identity_resource = self._resource("/system/identity")
             result = identity_resource.get()
             if result:
                 return result[0].get("name") if isinstance(result, list) else result.get("name")
@@ -133,12 +413,21 @@ class MikrotikClient:
             logger.error(f"Error getting identity from {self.host}: {e}")
             return None
 
-    def _execute_command(self, path: str) -> List[Dict]:
+    def _execute_command(
+        self,
+        path: str,
+        proplist: Optional[List[str]] = None,
+        queries: Optional[Dict] = None,
+    ) -> List[Dict]:
         """
         Execute a RouterOS API command.
 
         Parameters:
             path (str): API path (e.g., '/interface/print').
+            proplist (Optional[List[str]]): Restrict the returned properties to
+                these fields (RouterOS '.proplist'), cutting bytes on the wire.
+            queries (Optional[Dict]): Server-side '?key=value' filters so the
+                router skips non-matching rows instead of shipping them all.
 
         Returns:
             List[Dict]: List of dictionaries with command results.
@@ -148,37 +437,212 @@ class MikrotikClient:
             return []
 
         try:
-            resource = self.api.get_resource(path)
-            result = resource.get()
+            resource = self._resource(path)
+            if proplist or queries:
+                arguments = {".proplist": ",".join(proplist)} if proplist else {}
+                result = resource.call("print", arguments, queries)
+            else:
+                result = resource.get()
 
-            # Convert to list and handle binary data
-            data = []
-            for item in result:
-                # Convert bytes to strings if necessary
-                clean_item = {}
-                for key, value in item.items():
-                    if isinstance(value, bytes):
-                        clean_item[key] = value.decode("utf-8", errors="ignore")
-                    else:
-                        clean_item[key] = value
-                data.append(clean_item)
-            return data
+            return self._clean_rows(result)
 
-        except Exception as e:
-            logger.error(f"Error executing command {path} on {self.host}: {e}")
-            return []
-        except ConnectionClosed as e:
-            logger.error(f"Connection closed executing command {path} on {self.host}: {e}")
-            self.api = None
-            return []
-        except OSError as e:
-            logger.error(f"OS error executing command {path} on {self.host}: {e}")
+        except (routeros_exceptions.RouterOsApiConnectionError, OSError) as e:
+            logger.error(f"Connection lost executing command {path} on {self.host}: {e}")
+            # Drop the whole connection state, not just the api handle, so the
+            # next connect() builds a fresh socket instead of reusing this one
             self.api = None
+            self.connection = None
+            self._resources = {}
             return []
         except Exception as e:
-            logger.error(f"Unexpected error executing command {path} on {self.host}: {e}")
+            logger.error(f"Error executing command {path} on {self.host}: {e}")
             return []
 
+    def _execute_command_iter(
+        self, path: str, proplist: Optional[List[str]] = None
+    ) -> Iterator[Dict]:
+        """
+        Stream the rows of a print command one at a time.
+
+        Unlike _execute_command this never materializes the full row list:
+        rows are yielded as their reply sentences arrive, which halves peak
+        memory on large tables such as /ppp/active on ISP concentrators.
+
+        Parameters:
+            path (str): API path (e.g., '/ppp/active').
+            proplist (Optional[List[str]]): Restrict the returned properties.
+
+        Yields:
+            Dict: One row per '!re' reply sentence.
+        """
+        if not self.api:
+            logger.error("Not connected to router")
+            return
+
+        resource = self._resource(path)
+        arguments = {".proplist": ",".join(proplist)} if proplist else {}
+        for item in resource.call_async("print", arguments):
+            if any(type(v) is bytes for v in item.values()):
+                item = {
+                    k: v.decode("utf-8", "ignore") if type(v) is bytes else v
+                    for k, v in item.items()
+                }
+            yield item
+
+    @staticmethod
+    def _clean_rows(result) -> List[Dict]:
+        """Materialize API rows, decoding bytes values only when present."""
+        rows = list(result)
+        # One probe on the first row: modern routeros_api already returns str
+        # values, so the decode pass is usually skipped entirely. 'type(v) is
+        # bytes' beats isinstance here - no subclasses ever come off the wire.
+        if not rows or not any(type(v) is bytes for v in rows[0].values()):
+            return rows
+
+        return [
+            {
+                k: v.decode("utf-8", "ignore") if type(v) is bytes else v
+                for k, v in item.items()
+            }
+            for item in rows
+        ]
+
+    def _pipeline(self, commands: List[Tuple[str, str, Dict]]) -> List[bool]:
+        """
+        Execute multiple RouterOS commands as one pipelined batch.
+
+        All command sentences are written to the API socket before any reply
+        is read, so N round-trips collapse into roughly one. Replies are
+        demultiplexed by the per-command tags the library assigns.
+
+        Parameters:
+            commands (List[Tuple[str, str, Dict]]): Tuples of
+                (path, command, arguments), e.g.
+                ('/ip/service', 'set', {'id': '*1', 'address': '10.0.0.0/8'}).
+
+        Returns:
+            List[bool]: Per-command success flags, in input order.
+        """
+        if not self.api:
+            logger.error("Not connected to router")
+            return [False] * len(commands)
+
+        promises = []
+        for path, command, arguments in commands:
+            resource = self._resource(path)
+            promises.append((path, command, resource.call_async(command, arguments or {})))
+
+        results = []
+        for path, command, promise in promises:
+            try:
+                promise.get()
+                results.append(True)
+            except Exception as e:
+                logger.error("Error in pipelined '%s' on %s (%s): %s", command, path, self.host, e)
+                results.append(False)
+        return results
+
+    def _execute_batch(
+        self, requests: List[Tuple[str, Optional[List[str]]]]
+    ) -> List[List[Dict]]:
+        """
+        Fetch several print commands in one pipelined burst.
+
+        All print sentences (each with its '.proplist') are written before any
+        reply is read, so a full collection pays roughly one round-trip instead
+        of one per resource.
+
+        Parameters:
+            requests (List[Tuple[str, Optional[List[str]]]]): Tuples of
+                (path, proplist), e.g. ('/interface', _IFACE_PROPS).
+
+        Returns:
+            List[List[Dict]]: One row list per request, in input order; a
+                failed command yields an empty list.
+        """
+        if not self.api:
+            logger.error("Not connected to router")
+            return [[] for _ in requests]
+
+        promises = []
+        for path, proplist in requests:
+            resource = self._resource(path)
+            arguments = {".proplist": ",".join(proplist)} if proplist else {}
+            promises.append((path, resource.call_async("print", arguments)))
+
+        batches = []
+        for index, (path, promise) in enumerate(promises):
+            try:
+                batches.append(self._clean_rows(promise.get()))
+            except (routeros_exceptions.RouterOsApiConnectionError, OSError) as e:
+                # The socket is gone: draining the remaining promises would
+                # just re-pay the timeout per command, so give up on them all
+                logger.error(
+                    f"Connection lost in batched print of {path} on {self.host}: {e}"
+                )
+                self.api = None
+                self.connection = None
+                self._resources = {}
+                batches.extend([] for _ in range(len(promises) - index))
+                break
+            except Exception as e:
+                logger.error("Error in batched print of %s on %s: %s", path, self.host, e)
+                batches.append([])
+        return batches
+
+    def _wait_for_file(self, filename: str, wait_time: float) -> bool:
+        """
+        Poll the router until a file appears, instead of sleeping blindly.
+
+        Uses exponential backoff (0.1 s doubling up to 1 s) so fast boards
+        return in well under a second while slow ones still get the full
+        window.
+
+        Parameters:
+            filename (str): Exact file name to wait for (e.g. 'x.backup').
+            wait_time (float): Maximum seconds to wait.
+
+        Returns:
+            bool: True if the file showed up before the deadline.
+        """
+        deadline = time.monotonic() + wait_time
+        delay = 0.1
+        while True:
+            result = self._execute_command("/file", proplist=["name"], queries={"name": filename})
+            if result:
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, 1.0)
+
+    def _wait_reachable(self, deadline_s: float = 5.0, initial: float = 0.1) -> bool:
+        """
+        Probe the router until it answers, with exponential backoff.
+
+        Replaces fixed post-change sleeps: a fast LAN router verifies in
+        ~100 ms instead of seconds, while a slow link gets retried until the
+        deadline instead of failing on a single premature probe.
+
+        Parameters:
+            deadline_s (float): Maximum seconds to keep probing.
+            initial (float): First backoff delay; doubles up to 1 s.
+
+        Returns:
+            bool: True if the router answered before the deadline.
+        """
+        deadline = time.monotonic() + deadline_s
+        delay = initial
+        while True:
+            if self._execute_command("/system/identity"):
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, 1.0)
+
     def get_system_identity(self) -> str:
         """
         Get the router identity/hostname.
@@ -186,10 +650,15 @@ class MikrotikClient:
         Returns:
             str: Router identity.
         """
+        # 'is not None' rather than truthiness: a router with an empty
+        # identity string should still be served from the cache
+        if self._identity_cache is not None:
+            return self._identity_cache
         try:
             result = self._execute_command("/system/identity")
             if result and len(result) > 0:
-                return result[0].get("name", self.host)
+                self._identity_cache = result[0].get("name", self.host)
+                return self._identity_cache
             else:
                 logger.warning(f"Empty result for identity from {self.host}")
                 return self.host
@@ -204,24 +673,34 @@ class MikrotikClient:
         Returns:
             Optional[SystemResource]: System resource information or None.
         """
+        # Version, board and architecture cannot change within one
+        # connection, so one fetch serves any repeat calls during a scrape
+        if self._resource_cache is not None:
+            return self._resource_cache
         try:
-            result = self._execute_command("/system/resource")
-            if result:
-                data = result[0]
-                return SystemResource(
-                    uptime=data.get("uptime", "unknown"),
-                    version=data.get("version", "unknown"),
-                    cpu=data.get("cpu", None),
-                    cpu_load=int(data.get("cpu-load", 0)),
-                    free_memory=int(data.get("free-memory", 0)),
-                    total_memory=int(data.get("total-memory", 0)),
-                    architecture_name=data.get("architecture-name", None),
-                    board_name=data.get("board-name", None),
-                )
+            result = self._execute_command("/system/resource", proplist=_SYSTEM_RESOURCE_PROPS)
+            self._resource_cache = self._parse_system_resource(result)
+            return self._resource_cache
         except Exception as e:
             logger.error(f"Error getting system resources from {self.host}: {e}")
         return None
 
+    def _parse_system_resource(self, result: List[Dict]) -> Optional[SystemResource]:
+        """Build a SystemResource from pre-fetched /system/resource rows."""
+        if not result:
+            return None
+        data = result[0]
+        return SystemResource.model_construct(
+            uptime=data.get("uptime", "unknown"),
+            version=data.get("version", "unknown"),
+            cpu=data.get("cpu", None),
+            cpu_load=int(data.get("cpu-load", 0)),
+            free_memory=int(data.get("free-memory", 0)),
+            total_memory=int(data.get("total-memory", 0)),
+            architecture_name=data.get("architecture-name", None),
+            board_name=data.get("board-name", None),
+        )
+
     def get_interfaces(self, include_wireless: bool = True) -> List[Interface]:
         """
         Get all network interfaces.
@@ -234,46 +713,68 @@ class MikrotikClient:
         """
         interfaces = []
         try:
-            result = self._execute_command("/interface")
-            for item in result:
-                # Parse MTU - handle 'auto' value
-                mtu_value = item.get("mtu")
-                if mtu_value and mtu_value != "auto":
-                    try:
-                        mtu = int(mtu_value)
-                    except (ValueError, TypeError):
-                        mtu = None
-                else:
-                    mtu = None
-
-                interface = Interface(
-                    name=item.get("name", ""),
-                    type=item.get("type", "unknown"),
-                    mtu=mtu,
-                    mac_address=item.get("mac-address", None),
-                    disabled=item.get("disabled", "false") == "true",
-                    running=item.get("running", "false") == "true",
-                    comment=item.get("comment", None),
+            result = self._execute_command("/interface", proplist=_IFACE_PROPS)
+            interfaces = self._parse_interfaces(result)
+
+            # Get wireless interface details (only if enabled and the router
+            # actually has wlan interfaces - saves the round-trip on wired-only
+            # routers, where /interface/wireless would just trap)
+            _WIRELESS_CAPS[self.host] = any(i.type == "wlan" for i in interfaces)
+            if include_wireless and _WIRELESS_CAPS[self.host]:
+                wireless_result = self._execute_command(
+                    "/interface/wireless", proplist=_WIRELESS_PROPS
                 )
-                interfaces.append(interface)
-
-            # Get wireless interface details (only if enabled)
-            if include_wireless:
-                wireless_result = self._execute_command("/interface/wireless")
-                for wlan in wireless_result:
-                    name = wlan.get("name", "")
-                    for interface in interfaces:
-                        if interface.name == name:
-                            interface.ssid = wlan.get("ssid", None)
-                            interface.mode = wlan.get("mode", None)
-                            interface.frequency = wlan.get("frequency", None)
-                            break
+                self._merge_wireless(interfaces, wireless_result)
 
         except Exception as e:
             logger.error(f"Error getting interfaces from {self.host}: {e}")
 
         return interfaces
 
+    def _parse_interfaces(self, result: List[Dict]) -> List[Interface]:
+        """Build Interface models from pre-fetched /interface rows."""
+        interfaces = []
+        for item in result:
+            name, type_, mtu_value, mac_address, disabled, running, comment = _IFACE_GET(
+                {**_IFACE_DEFAULTS, **item}
+            )
+
+            # Parse MTU - handle 'auto' value
+            if mtu_value and mtu_value != "auto":
+                try:
+                    mtu = int(mtu_value)
+                except (ValueError, TypeError):
+                    mtu = None
+            else:
+                mtu = None
+
+            # Rows are fully normalized above (types coerced, defaults
+            # merged), so skip pydantic validation on construction; the
+            # inventory load boundary still validates in full
+            interface = Interface.model_construct(
+                name=name,
+                type=type_,
+                mtu=mtu,
+                mac_address=mac_address,
+                disabled=_BOOL.get(disabled, False),
+                running=_BOOL.get(running, False),
+                comment=comment,
+            )
+            interfaces.append(interface)
+        return interfaces
+
+    def _merge_wireless(
+        self, interfaces: List[Interface], wireless_result: List[Dict]
+    ) -> None:
+        """Attach SSID/mode/frequency from /interface/wireless rows by name."""
+        by_name = {interface.name: interface for interface in interfaces}
+        for wlan in wireless_result:
+            interface = by_name.get(wlan.get("name", ""))
+            if interface is not None:
+                interface.ssid = wlan.get("ssid", None)
+                interface.mode = wlan.get("mode", None)
+                interface.frequency = wlan.get("frequency", None)
+
     def get_ip_addresses(self) -> List[IPAddress]:
         """
         Get all configured IP addresses.
@@ -281,21 +782,28 @@ class MikrotikClient:
         Returns:
             List[IPAddress]: List of IP address objects.
         """
-        ip_addresses = []
         try:
-            result = self._execute_command("/ip/address")
-            for item in result:
-                ip_addr = IPAddress(
-                    address=item.get("address", ""),
-                    network=item.get("network", ""),
-                    interface=item.get("interface", ""),
-                    disabled=item.get("disabled", "false") == "true",
-                    comment=item.get("comment", None),
-                )
-                ip_addresses.append(ip_addr)
+            result = self._execute_command("/ip/address", proplist=_IP_ADDRESS_PROPS)
+            return self._parse_ip_addresses(result)
         except Exception as e:
             logger.error(f"Error getting IP addresses from {self.host}: {e}")
+            return []
 
+    def _parse_ip_addresses(self, result: List[Dict]) -> List[IPAddress]:
+        """Build IPAddress models from pre-fetched /ip/address rows."""
+        ip_addresses = []
+        for item in result:
+            address, network, interface, disabled, comment = _IP_ADDRESS_GET(
+                {**_IP_ADDRESS_DEFAULTS, **item}
+            )
+            ip_addr = IPAddress.model_construct(
+                address=address,
+                network=network,
+                interface=interface,
+                disabled=_BOOL.get(disabled, False),
+                comment=comment,
+            )
+            ip_addresses.append(ip_addr)
         return ip_addresses
 
     def get_neighbors(self) -> List[Neighbor]:
@@ -305,22 +813,29 @@ class MikrotikClient:
         Returns:
             List[Neighbor]: List of neighbor objects.
         """
-        neighbors = []
         try:
-            result = self._execute_command("/ip/neighbor")
-            for item in result:
-                neighbor = Neighbor(
-                    interface=item.get("interface", ""),
-                    identity=item.get("identity", "unknown"),
-                    address=item.get("address", None),
-                    platform=item.get("platform", None),
-                    version=item.get("version", None),
-                    mac_address=item.get("mac-address", None),
-                )
-                neighbors.append(neighbor)
+            result = self._execute_command("/ip/neighbor", proplist=_NEIGHBOR_PROPS)
+            return self._parse_neighbors(result)
         except Exception as e:
             logger.error(f"Error getting neighbors from {self.host}: {e}")
+            return []
 
+    def _parse_neighbors(self, result: List[Dict]) -> List[Neighbor]:
+        """Build Neighbor models from pre-fetched /ip/neighbor rows."""
+        neighbors = []
+        for item in result:
+            interface, identity, address, platform, version, mac_address = _NEIGHBOR_GET(
+                {**_NEIGHBOR_DEFAULTS, **item}
+            )
+            neighbor = Neighbor.model_construct(
+                interface=interface,
+                identity=identity,
+                address=address,
+                platform=platform,
+                version=version,
+                mac_address=mac_address,
+            )
+            neighbors.append(neighbor)
         return neighbors
 
     def get_pppoe_active(self) -> List[PPPoEActive]:
@@ -330,22 +845,37 @@ class MikrotikClient:
         Returns:
             List[PPPoEActive]: List of active PPPoE connection objects.
         """
-        pppoe_active = []
         try:
-            result = self._execute_command("/ppp/active")
-            for item in result:
-                pppoe = PPPoEActive(
-                    name=item.get("name", ""),
-                    service=item.get("service", None),
-                    caller_id=item.get("caller-id", ""),
-                    address=item.get("address", ""),
-                    uptime=item.get("uptime", "0s"),
-                    encoding=item.get("encoding", None),
-                )
-                pppoe_active.append(pppoe)
+            rows = self._execute_command_iter("/ppp/active", proplist=_PPPOE_ACTIVE_PROPS)
+            return self._parse_pppoe_active(rows)
         except Exception as e:
             logger.error(f"Error getting active PPPoE connections from {self.host}: {e}")
+            return []
 
+    def _parse_pppoe_active(self, result: Iterable[Dict]) -> List[PPPoEActive]:
+        """Build PPPoEActive models from pre-fetched /ppp/active rows."""
+        # Local bindings: this and the secrets parser see the largest tables
+        # (thousands of sessions on concentrators), where per-row global and
+        # method lookups add up
+        defaults = _PPPOE_ACTIVE_DEFAULTS
+        unpack = _PPPOE_ACTIVE_GET
+        model = PPPoEActive.model_construct
+        pppoe_active = []
+        append = pppoe_active.append
+        for item in result:
+            name, service, caller_id, address, uptime, encoding = unpack(
+                {**defaults, **item}
+            )
+            append(
+                model(
+                    name=name,
+                    service=service,
+                    caller_id=caller_id,
+                    address=address,
+                    uptime=uptime,
+                    encoding=encoding,
+                )
+            )
         return pppoe_active
 
     def get_pppoe_secrets(self) -> List[PPPoESecret]:
@@ -355,24 +885,45 @@ class MikrotikClient:
         Returns:
             List[PPPoESecret]: List of PPPoE secret objects.
         """
-        pppoe_secrets = []
         try:
-            result = self._execute_command("/ppp/secret")
-            for item in result:
-                secret = PPPoESecret(
-                    name=item.get("name", ""),
-                    password=item.get("password", None),
-                    service=item.get("service", None),
-                    profile=item.get("profile", "default"),
-                    local_address=item.get("local-address", None),
-                    remote_address=item.get("remote-address", None),
-                    disabled=item.get("disabled", "false") == "true",
-                    comment=item.get("comment", None),
-                )
-                pppoe_secrets.append(secret)
+            rows = self._execute_command_iter("/ppp/secret", proplist=_PPPOE_SECRET_PROPS)
+            return self._parse_pppoe_secrets(rows)
         except Exception as e:
             logger.error(f"Error getting PPPoE secrets from {self.host}: {e}")
+            return []
 
+    def _parse_pppoe_secrets(self, result: Iterable[Dict]) -> List[PPPoESecret]:
+        """Build PPPoESecret models from pre-fetched /ppp/secret rows."""
+        # Local bindings: see _parse_pppoe_active
+        defaults = _PPPOE_SECRET_DEFAULTS
+        unpack = _PPPOE_SECRET_GET
+        bool_of = _BOOL.get
+        model = PPPoESecret.model_construct
+        pppoe_secrets = []
+        append = pppoe_secrets.append
+        for item in result:
+            (
+                name,
+                password,
+                service,
+                profile,
+                local_address,
+                remote_address,
+                disabled,
+                comment,
+            ) = unpack({**defaults, **item})
+            append(
+                model(
+                    name=name,
+                    password=password,
+                    service=service,
+                    profile=profile,
+                    local_address=local_address,
+                    remote_address=remote_address,
+                    disabled=bool_of(disabled, False),
+                    comment=comment,
+                )
+            )
         return pppoe_secrets
 
     def get_schedulers(self) -> List[Scheduler]:
@@ -384,26 +935,43 @@ class MikrotikClient:
         """
         schedulers = []
         try:
-            result = self._execute_command("/system/scheduler")
-            for item in result:
-                scheduler = Scheduler(
-                    name=item.get("name", ""),
-                    start_date=item.get("start-date", None),
-                    start_time=item.get("start-time", None),
-                    interval=item.get("interval", None),
-                    on_event=item.get("on-event", None),
-                    policy=item.get("policy", None),
-                    disabled=item.get("disabled", "false") == "true",
-                    run_count=int(item.get("run-count", 0)) if item.get("run-count") else None,
-                    next_run=item.get("next-run", None),
-                )
-                schedulers.append(scheduler)
-            logger.info(f"Retrieved {len(schedulers)} schedulers from {self.host}")
+            result = self._execute_command("/system/scheduler", proplist=_SCHEDULER_PROPS)
+            schedulers = self._parse_schedulers(result)
+            logger.info("Retrieved %d schedulers from %s", len(schedulers), self.host)
         except Exception as e:
             logger.error(f"Error getting schedulers from {self.host}: {e}")
 
         return schedulers
 
+    def _parse_schedulers(self, result: List[Dict]) -> List[Scheduler]:
+        """Build Scheduler models from pre-fetched /system/scheduler rows."""
+        schedulers = []
+        for item in result:
+            (
+                name,
+                start_date,
+                start_time,
+                interval,
+                on_event,
+                policy,
+                disabled,
+                run_count,
+                next_run,
+            ) = _SCHEDULER_GET({**_SCHEDULER_DEFAULTS, **item})
+            scheduler = Scheduler.model_construct(
+                name=name,
+                start_date=start_date,
+                start_time=start_time,
+                interval=interval,
+                on_event=on_event,
+                policy=policy,
+                disabled=_BOOL.get(disabled, False),
+                run_count=_to_int(run_count),
+                next_run=next_run,
+            )
+            schedulers.append(scheduler)
+        return schedulers
+
 
     def collect_all_data(
         self, collection_options: Optional[Dict] = None
@@ -422,59 +990,77 @@ class MikrotikClient:
         if not self.connect():
             return None, f"Failed to connect to {self.host}"
 
-        # Default collection options - collect everything
-        if collection_options is None:
-            collection_options = {
-                "system_info": True,
-                "interfaces": True,
-                "ip_addresses": True,
-                "neighbors": True,
-                "pppoe_active": True,
-                "pppoe_secrets": True,
-                "wireless": True,
-                "schedulers": False,  # Optional: disabled by default
-            }
-
+        # Normalize options once: merge over the defaults and resolve the
+        # booleans up front instead of repeated .get(key, True) calls below
+        opts = {**_DEFAULT_COLLECTION_OPTIONS, **(collection_options or {})}
+        do_system_info = opts["system_info"]
+        do_interfaces = opts["interfaces"]
+        do_ip_addresses = opts["ip_addresses"]
+        do_neighbors = opts["neighbors"]
+        do_pppoe_active = opts["pppoe_active"]
+        do_pppoe_secrets = opts["pppoe_secrets"]
+        do_wireless = opts["wireless"]
+        do_schedulers = opts["schedulers"]
 
         try:
             identity = self.get_system_identity()
             logger.info(f"Collecting data from router: {identity} ({self.host})")
 
-            # Collect system resources if enabled
-            system_resource = None
-            if collection_options.get("system_info", True):
-                system_resource = self.get_system_resource()
-
-            # Collect interfaces if enabled
-            interfaces = []
-            if collection_options.get("interfaces", True):
-                include_wireless = collection_options.get("wireless", True)
-                interfaces = self.get_interfaces(include_wireless=include_wireless)
-
-            # Collect IP addresses if enabled
-            ip_addresses = []
-            if collection_options.get("ip_addresses", True):
-                ip_addresses = self.get_ip_addresses()
-
-            # Collect neighbors if enabled
-            neighbors = []
-            if collection_options.get("neighbors", True):
-                neighbors = self.get_neighbors()
-
-            # Collect PPPoE active if enabled
-            pppoe_active = []
-            if collection_options.get("pppoe_active", True):
-                pppoe_active = self.get_pppoe_active()
-
-            # Collect PPPoE secrets if enabled
-            pppoe_secrets = []
-            if collection_options.get("pppoe_secrets", True):
-                pppoe_secrets = self.get_pppoe_secrets()
-
-            # Collect schedulers if enabled
-            schedulers = []
-            if collection_options.get("schedulers", True):
-                schedulers = self.get_schedulers()
+            # Build the enabled print commands once and fire them as a single
+            # pipelined burst instead of one round-trip per resource
+            batch_requests = []
+            if do_system_info:
+                batch_requests.append(("/system/resource", _SYSTEM_RESOURCE_PROPS))
+            if do_interfaces:
+                batch_requests.append(("/interface", _IFACE_PROPS))
+                if do_wireless and _WIRELESS_CAPS.get(self.host, True):
+                    batch_requests.append(("/interface/wireless", _WIRELESS_PROPS))
+            if do_ip_addresses:
+                batch_requests.append(("/ip/address", _IP_ADDRESS_PROPS))
+            if do_neighbors:
+                batch_requests.append(("/ip/neighbor", _NEIGHBOR_PROPS))
+            if do_pppoe_active:
+                batch_requests.append(("/ppp/active", _PPPOE_ACTIVE_PROPS))
+            if do_pppoe_secrets:
+                batch_requests.append(("/ppp/secret", _PPPOE_SECRET_PROPS))
+            if do_schedulers:
+                batch_requests.append(("/system/scheduler", _SCHEDULER_PROPS))
+
+            rows = dict(
+                zip((path for path, _ in batch_requests), self._execute_batch(batch_requests))
+            )
+
+            # A connection loss during the batch cleared self.api; report a
+            # failed partial collection instead of parsing empty buckets
+            if self.api is None:
+                error_msg = f"Connection to {self.host} lost during collection"
+                logger.error(error_msg)
+                return (
+                    Router(
+                        ip_address=self.host,
+                        identity=identity,
+                        connection_successful=False,
+                    ),
+                    error_msg,
+                )
+
+            system_resource = (
+                self._parse_system_resource(rows["/system/resource"]) if do_system_info else None
+            )
+
+            interfaces = self._parse_interfaces(rows["/interface"]) if do_interfaces else []
+            if do_interfaces:
+                _WIRELESS_CAPS[self.host] = any(i.type == "wlan" for i in interfaces)
+            if do_interfaces and do_wireless and "/interface/wireless" in rows:
+                self._merge_wireless(interfaces, rows["/interface/wireless"])
+
+            ip_addresses = self._parse_ip_addresses(rows["/ip/address"]) if do_ip_addresses else []
+            neighbors = self._parse_neighbors(rows["/ip/neighbor"]) if do_neighbors else []
+            pppoe_active = self._parse_pppoe_active(rows["/ppp/active"]) if do_pppoe_active else []
+            pppoe_secrets = (
+                self._parse_pppoe_secrets(rows["/ppp/secret"]) if do_pppoe_secrets else []
+            )
+            schedulers = self._parse_schedulers(rows["/system/scheduler"]) if do_schedulers else []
 
             router = Router(
                 ip_address=self.host,
@@ -490,11 +1076,13 @@ class MikrotikClient:
             )
 
             logger.info(
-                f"Successfully collected data from {identity}: "
-                f"{len(router.interfaces)} interfaces, "
-                f"{len(router.neighbors)} neighbors, "
-                f"{len(router.pppoe_active)} active PPPoE, "
-                f"{len(router.schedulers)} schedulers"
+                "Successfully collected data from %s: %d interfaces, %d neighbors, "
+                "%d active PPPoE, %d schedulers",
+                identity,
+                len(router.interfaces),
+                len(router.neighbors),
+                len(router.pppoe_active),
+                len(router.schedulers),
             )
 
             return router, None
@@ -526,8 +1114,6 @@ class MikrotikClient:
             return False, None
 
         try:
-            import time
-
             if backup_name is None:
                 timestamp = time.strftime("%Y%m%d")
                 # Get system identity from router
@@ -538,20 +1124,24 @@ class MikrotikClient:
 
             logger.info(f"Creating backup on {self.host}: {backup_name}")
 
-            backup_resource = self.api.get_resource("/system/backup")
+            backup_resource = self._resource("/system/backup")
             params = {"name": backup_name}
 
             if password:
                 params["password"] = password
 
             backup_resource.call("save", params)
+            self._file_cache = None
 
             logger.info(f"Backup created successfully: {backup_name}")
-            
-            # Wait for backup file to be written
-            logger.info(f"Waiting {wait_time}s for backup file to be available...")
-            time.sleep(wait_time)
-            
+
+            # Poll until the backup file is on disk (bounded by wait_time)
+            backup_file = f"{backup_name}.backup"
+            if self._wait_for_file(backup_file, wait_time):
+                logger.info(f"Backup file {backup_file} is available")
+            else:
+                logger.warning(f"Backup file {backup_file} not visible after {wait_time}s")
+
             return True, backup_name
 
         except Exception as e:
@@ -576,8 +1166,6 @@ class MikrotikClient:
             return False, None
 
         try:
-            import time
-
             if export_name is None:
                 timestamp = time.strftime("%Y%m%d")
                 # Get system identity from router
@@ -588,14 +1176,22 @@ class MikrotikClient:
 
             logger.info(f"Exporting configuration from {self.host}: {export_name}")
 
-            # The /export command is not directly available via API
-            # We need to use terminal or script execution
-            # For now, return success and let the file be created by RouterOS itself
-            # when accessed via SFTP download
-            logger.info(f"Configuration export queued: {export_name}")
-            logger.info(f"Waiting {wait_time}s for export to complete...")
-            time.sleep(wait_time)
-            
+            # RouterOS >= 6.43 exposes /export as a regular API command, so no
+            # second transport is needed on modern routers
+            try:
+                self._resource("/").call("export", {"file": export_name})
+                self._file_cache = None
+            except Exception as e:
+                # Older versions lack the command; the file may still be
+                # produced by an external mechanism, so only warn here
+                logger.warning(f"API /export failed on {self.host}: {e}")
+
+            # Poll for the export file instead of a fixed sleep
+            if self._wait_for_file(f"{export_name}.rsc", wait_time):
+                logger.info(f"Export file {export_name}.rsc is available")
+            else:
+                logger.warning(f"Export file {export_name}.rsc not visible after {wait_time}s")
+
             # Return success - the actual file will be verified via SFTP
             return True, export_name
 
@@ -610,25 +1206,24 @@ class MikrotikClient:
         ssh_client = None
     ) -> Tuple[bool, Optional[List[str]]]:
         """
-        Export the router configuration in both normal and verbose modes as RSC scripts via SSH.
-        
-        This method uses SSH to execute /export commands directly on the router.
+        Export the router configuration in both normal and verbose modes as RSC scripts.
+
+        The exports are issued over the API channel when available (RouterOS
+        >= 6.43); SSH is kept as a fallback for older versions.
 
         Parameters:
             export_name (Optional[str]): Name for the export file (without extension).
             wait_time (int): Seconds to wait after export (default: 10).
-            ssh_client: SFTPClientManager instance with SSH connection.
+            ssh_client: SFTPClientManager instance with SSH connection (fallback).
 
         Returns:
             Tuple[bool, Optional[List[str]]]: (Success status, list of export filenames if successful).
         """
-        if not ssh_client:
-            logger.error("SSH client not provided")
+        if not self.api and not ssh_client:
+            logger.error("Neither API connection nor SSH client available")
             return False, None
 
         try:
-            import time
-
             if export_name is None:
                 timestamp = time.strftime("%Y%m%d")
                 # Get system identity from router
@@ -637,74 +1232,132 @@ class MikrotikClient:
                 clean_identity = system_identity.replace(" ", "_").replace("/", "_").upper()
                 export_name = f"{timestamp}_{clean_identity}"
 
-            logger.info(f"Exporting configuration (both normal and verbose) from {self.host} via SSH: {export_name}")
-
-            export_filenames = []
+            logger.info(
+                f"Exporting configuration (both normal and verbose) from {self.host}: {export_name}"
+            )
 
-            # Export normal version via SSH
             normal_name = export_name
-            logger.info(f"Executing SSH command: /export file={normal_name}")
-            success, stdout, stderr = ssh_client.execute_command(f"/export file={normal_name}", timeout=30)
-            
-            if success:
-                logger.info(f"Normal configuration exported successfully: {normal_name}")
-                export_filenames.append(normal_name)
-            else:
-                logger.warning(f"Normal configuration export failed: {stderr}")
-
-            # Wait between exports
-            time.sleep(2)
-
-            # Export verbose version via SSH
             verbose_name = f"{export_name}_verbose"
-            logger.info(f"Executing SSH command: /export verbose file={verbose_name}")
-            success, stdout, stderr = ssh_client.execute_command(f"/export verbose file={verbose_name}", timeout=30)
-            
-            if success:
-                logger.info(f"Verbose configuration exported successfully: {verbose_name}")
-                export_filenames.append(verbose_name)
-            else:
-                logger.warning(f"Verbose configuration export failed: {stderr}")
+            export_filenames = []
+
+            # Prefer the API channel: an SSH handshake costs several round
+            # trips plus a key exchange just to run two commands
+            api_export_ok = False
+            if self.api:
+                try:
+                    root = self._resource("/")
+                    root.call("export", {"file": normal_name})
+                    export_filenames.append(normal_name)
+                    root.call("export", {"file": verbose_name, "verbose": ""})
+                    export_filenames.append(verbose_name)
+                    api_export_ok = True
+                    self._file_cache = None
+                    logger.info(f"Configuration exports issued via API: {export_filenames}")
+                except Exception as e:
+                    logger.warning(
+                        f"API /export failed on {self.host}, falling back to SSH: {e}"
+                    )
+                    export_filenames = []
+
+            if not api_export_ok:
+                if not ssh_client:
+                    logger.error("SSH client not provided")
+                    return False, None
+
+                # Run both exports over one SSH channel: channel setup costs
+                # more than the exports themselves, and the short :delay lets
+                # the first export flush before the verbose one starts
+                command = (
+                    f"/export file={normal_name}; :delay 500ms; "
+                    f"/export verbose file={verbose_name}"
+                )
+                logger.info(f"Executing SSH command: {command}")
+                success, stdout, stderr = ssh_client.execute_command(command, timeout=60)
 
-            # Wait for files to be written
-            logger.info(f"Waiting {wait_time}s for export files to be written...")
-            time.sleep(wait_time)
+                if success:
+                    logger.info(
+                        f"Configuration exports issued via SSH: {normal_name}, {verbose_name}"
+                    )
+                    export_filenames.extend((normal_name, verbose_name))
+                else:
+                    logger.warning(f"SSH configuration export failed: {stderr}")
+
+            # Poll until the export files are written (bounded by wait_time)
+            deadline = time.monotonic() + wait_time
+            delay = 0.1
+            pending = [f"{name}.rsc" for name in export_filenames]
+            while pending and time.monotonic() < deadline:
+                if self.api:
+                    pending = [f for f in pending if not self._wait_for_file(f, 0)]
+                else:
+                    pending = [f for f in pending if not ssh_client.file_exists(f)]
+                if pending:
+                    time.sleep(delay)
+                    delay = min(delay * 2, 1.0)
+            if pending:
+                logger.warning(f"Export files not visible after {wait_time}s: {pending}")
 
             if export_filenames:
-                logger.info(f"Configuration exports completed via SSH: {export_filenames}")
+                self._file_cache = None
+                logger.info(f"Configuration exports completed: {export_filenames}")
                 return True, export_filenames
             else:
                 logger.error("No configurations were exported successfully")
                 return False, None
 
         except Exception as e:
-            logger.error(f"Error exporting configuration via SSH from {self.host}: {e}")
+            logger.error(f"Error exporting configuration from {self.host}: {e}")
             return False, None
 
-    def list_backup_files(self) -> Optional[List[str]]:
+    def _list_files(self, suffix: str) -> Optional[List[str]]:
         """
-        List available backup files on the router.
+        List router file names with the given suffix from a short-lived cache.
+
+        Sessions that back up and export in quick succession would otherwise
+        fetch /file once per listing; one names-only fetch serves both for
+        _FILE_CACHE_TTL seconds, bucketed by suffix in a single pass so the
+        per-listing calls are plain dict reads. The backup/export paths
+        invalidate the cache after creating files.
+
+        Parameters:
+            suffix (str): File name suffix to match (one of _FILE_SUFFIXES).
 
         Returns:
-            Optional[List[str]]: List of backup filenames, or None if error occurs.
+            Optional[List[str]]: Matching filenames, or None if error occurs.
         """
         if not self.api:
             logger.error("Not connected to router")
             return None
 
         try:
-            result = self._execute_command("/file")
-            backup_files = [
-                item.get("name", "")
-                for item in result
-                if item.get("name", "").endswith(".backup")
-            ]
-            logger.info(f"Found {len(backup_files)} backup files on {self.host}")
-            return backup_files
+            now = time.monotonic()
+            if self._file_cache is None or now - self._file_cache[0] > _FILE_CACHE_TTL:
+                result = self._execute_command("/file", proplist=["name"])
+                buckets: Dict[str, List[str]] = {s: [] for s in _FILE_SUFFIXES}
+                for item in result:
+                    name = item.get("name", "")
+                    for s in _FILE_SUFFIXES:
+                        if name.endswith(s):
+                            buckets[s].append(name)
+                            break
+                self._file_cache = (now, buckets)
+            return list(self._file_cache[1].get(suffix, ()))
         except Exception as e:
-            logger.error(f"Error listing backup files on {self.host}: {e}")
+            logger.error(f"Error listing files on {self.host}: {e}")
             return None
 
+    def list_backup_files(self) -> Optional[List[str]]:
+        """
+        List available backup files on the router.
+
+        Returns:
+            Optional[List[str]]: List of backup filenames, or None if error occurs.
+        """
+        backup_files = self._list_files(".backup")
+        if backup_files is not None:
+            logger.info("Found %d backup files on %s", len(backup_files), self.host)
+        return backup_files
+
     def list_rsc_files(self) -> Optional[List[str]]:
         """
         List available RSC (export) files on the router.
@@ -712,22 +1365,10 @@ class MikrotikClient:
         Returns:
             Optional[List[str]]: List of RSC filenames, or None if error occurs.
         """
-        if not self.api:
-            logger.error("Not connected to router")
-            return None
-
-        try:
-            result = self._execute_command("/file")
-            rsc_files = [
-                item.get("name", "")
-                for item in result
-                if item.get("name", "").endswith(".rsc")
-            ]
-            logger.info(f"Found {len(rsc_files)} RSC files on {self.host}")
-            return rsc_files
-        except Exception as e:
-            logger.error(f"Error listing RSC files on {self.host}: {e}")
-            return None
+        rsc_files = self._list_files(".rsc")
+        if rsc_files is not None:
+            logger.info("Found %d RSC files on %s", len(rsc_files), self.host)
+        return rsc_files
 
     def get_ip_services(self) -> List[IPService]:
         """
@@ -738,17 +1379,19 @@ class MikrotikClient:
         """
         services = []
         try:
-            result = self._execute_command("/ip/service")
+            result = self._execute_command(
+                "/ip/service", proplist=["name", "port", "disabled", "address", "certificate"]
+            )
             for item in result:
                 service = IPService(
                     name=item.get("name", ""),
                     port=int(item.get("port", 0)),
-                    disabled=item.get("disabled", "false") == "true",
+                    disabled=_BOOL.get(item.get("disabled"), False),
                     address=item.get("address", None),
                     certificate=item.get("certificate", None),
                 )
                 services.append(service)
-            logger.info(f"Retrieved {len(services)} IP services from {self.host}")
+            logger.info("Retrieved %d IP services from %s", len(services), self.host)
         except Exception as e:
             logger.error(f"Error getting IP services from {self.host}: {e}")
 
@@ -780,16 +1423,16 @@ class MikrotikClient:
             return False, None, "Not connected to router"
 
         try:
-            import time
-
-            # Step 1: Get current configuration for rollback
+            # Step 1: Get current configuration once; the same fetch serves both
+            # the rollback snapshot and the id lookups during apply
             logger.info(f"Reading current IP services configuration from {self.host}")
-            current_services = self.get_ip_services()
-            
+            ip_service_resource = self._resource("/ip/service")
+            services_by_name = {svc.get("name", ""): svc for svc in ip_service_resource.get()}
+
             # Create a map of current addresses for rollback
             current_config = {
-                svc.name: svc.address if svc.address else ""
-                for svc in current_services
+                name: svc.get("address") or ""
+                for name, svc in services_by_name.items()
             }
 
             # Step 2: Create rollback scheduler if requested
@@ -799,35 +1442,48 @@ class MikrotikClient:
                 logger.info(f"Creating rollback scheduler '{scheduler_name}' on {self.host}")
 
                 # Build rollback commands
+                script_name = f"{scheduler_name}-script"
                 rollback_commands = []
                 for config in service_configs:
                     service_name = config.service_name
                     original_address = current_config.get(service_name, "")
                     # Escape quotes in addresses
-                    escaped_address = original_address.replace('"', '\\"')
+                    escaped_address = original_address.translate(_QUOTE_ESCAPE)
                     rollback_commands.append(
                         f'/ip service set [find name="{service_name}"] address="{escaped_address}"'
                     )
 
-                # Combine commands into single script
-                rollback_script = "; ".join(rollback_commands)
-                
-                # Add scheduler cleanup at the end
-                rollback_script += f'; /system scheduler remove [find name="{scheduler_name}"]'
+                # The script cleans up both itself and the scheduler after running
+                rollback_commands.append(
+                    f'/system scheduler remove [find name="{scheduler_name}"]'
+                )
+                rollback_commands.append(f'/system script remove [find name="{script_name}"]')
+
+                # Newline-separated commands; RouterOS parses these faster
+                # than one long ';'-chained line
+                rollback_script = "\n".join(rollback_commands)
 
                 try:
-                    scheduler_resource = self.api.get_resource("/system/scheduler")
-                    
+                    # Store the body once as a named script: the scheduler row
+                    # stays small and the router caches the parsed script
+                    self._resource("/system/script").add(
+                        name=script_name,
+                        source=rollback_script,
+                        policy="read,write,policy",
+                    )
+
+                    scheduler_resource = self._resource("/system/scheduler")
+
                     # Calculate start time (now + timeout)
-                    from datetime import datetime, timedelta
-                    start_time = datetime.now() + timedelta(seconds=rollback_timeout)
-                    start_time_str = start_time.strftime("%H:%M:%S")
+                    start_time_str = time.strftime(
+                        "%H:%M:%S", time.localtime(time.time() + rollback_timeout)
+                    )
 
                     scheduler_resource.add(
                         name=scheduler_name,
                         start_time=start_time_str,
                         interval=f"{rollback_timeout}s",
-                        on_event=rollback_script,
+                        on_event=f"/system script run {script_name}",
                         policy="read,write,policy",
                     )
                     logger.info(
@@ -839,43 +1495,52 @@ class MikrotikClient:
 
             # Step 3: Apply new configuration
             logger.info(f"Applying IP service configuration to {self.host}")
-            ip_service_resource = self.api.get_resource("/ip/service")
 
+            # Collect all set commands and send them as one pipelined batch
+            pending_commands = []
+            pending_names = []
             for config in service_configs:
-                try:
-                    service_name = config.service_name
-                    addresses = config.addresses
+                service_name = config.service_name
+                addresses = config.addresses
 
-                    logger.info(
-                        f"Setting {service_name} service addresses to: {addresses}"
-                    )
+                logger.info("Setting %s service addresses to: %s", service_name, addresses)
 
-                    # Find the service entry
-                    services = ip_service_resource.get(name=service_name)
-                    if not services:
-                        logger.warning(f"Service '{service_name}' not found on {self.host}")
-                        continue
-
-                    service_id = services[0].get("id") or services[0].get(".id")
-                    
-                    # Update the service
-                    ip_service_resource.set(id=service_id, address=addresses)
-                    
-                    logger.info(f"Successfully configured {service_name} service")
+                # Find the service entry in the snapshot fetched above
+                service = services_by_name.get(service_name)
+                if not service:
+                    logger.warning("Service '%s' not found on %s", service_name, self.host)
+                    continue
 
-                except Exception as e:
-                    logger.error(f"Error configuring {service_name} service: {e}")
-                    # Don't fail completely, continue with other services
+                # Skip the set entirely when the service already carries the
+                # requested addresses: RouterOS persists /ip service on every
+                # set, so an idempotent skip saves a round-trip and flash wear
+                current_addresses = _normalize_csv(service.get("address") or "")
+                target_addresses = _normalize_csv(addresses)
+                if current_addresses == target_addresses:
+                    logger.info("%s service already restricted to %s, skipping", service_name, addresses)
                     continue
 
-            # Step 4: Verify connection is still active
+                service_id = _row_id(service)
+
+                pending_commands.append(
+                    ("/ip/service", "set", {"id": service_id, "address": addresses})
+                )
+                pending_names.append(service_name)
+
+            for service_name, ok in zip(pending_names, self._pipeline(pending_commands)):
+                if ok:
+                    logger.info("Successfully configured %s service", service_name)
+                else:
+                    # Don't fail completely, the remaining services were still attempted
+                    logger.error("Error configuring %s service", service_name)
+
+            # Step 4: Verify connection is still active. Retry with backoff
+            # instead of a blind sleep: returns in ~100ms when the changes
+            # were harmless, keeps probing within the window when they weren't
             logger.info(f"Verifying connection to {self.host} after configuration")
-            time.sleep(2)  # Wait a moment for changes to apply
 
             try:
-                # Try to execute a simple command to verify connection
-                test_result = self._execute_command("/system/identity")
-                if not test_result:
+                if not self._wait_reachable():
                     raise Exception("Connection verification failed")
                 logger.info(f"Connection verification successful")
             except Exception as e:
@@ -889,10 +1554,15 @@ class MikrotikClient:
                     f"Configuration applied but connection lost. Rollback will execute automatically.",
                 )
 
-            # Step 5: Remove rollback scheduler (configuration successful)
+            # Step 5: Remove rollback scheduler and script (configuration successful)
             if scheduler_name:
                 try:
-                    self.sftp.execute_command(f"/system scheduler remove [find name={scheduler_name}]")
+                    scheduler_resource = self._resource("/system/scheduler")
+                    for row in scheduler_resource.get(name=scheduler_name):
+                        scheduler_resource.remove(id=_row_id(row))
+                    script_resource = self._resource("/system/script")
+                    for row in script_resource.get(name=f"{scheduler_name}-script"):
+                        script_resource.remove(id=_row_id(row))
                     logger.info(f"Rollback scheduler {scheduler_name} removed")
                 except Exception as e:
                     logger.warning(f"Failed to remove rollback scheduler {scheduler_name}: {e}")
@@ -907,6 +1577,20 @@ class MikrotikClient:
             logger.error(error_msg)
             return False, scheduler_name, error_msg
 
+    def get_ip_services_by_name(self, service_names: List[str]) -> Dict[str, IPService]:
+        """
+        Get several IP service configurations in a single fetch.
+
+        Parameters:
+            service_names (List[str]): Names of the services (e.g., ['api', 'ssh', 'www']).
+
+        Returns:
+            Dict[str, IPService]: Mapping of service name to configuration for the
+                requested services that exist on the router.
+        """
+        wanted = set(service_names)
+        return {svc.name: svc for svc in self.get_ip_services() if svc.name in wanted}
+
     def get_ip_service_by_name(self, service_name: str) -> Optional[IPService]:
         """
         Get a specific IP service configuration by name.
@@ -917,11 +1601,7 @@ class MikrotikClient:
         Returns:
             Optional[IPService]: Service configuration or None if not found.
         """
-        services = self.get_ip_services()
-        for service in services:
-            if service.name == service_name:
-                return service
-        return None
+        return self.get_ip_services_by_name([service_name]).get(service_name)
 
     def get_user_groups(self) -> List[Dict]:
         """Get all user groups."""
@@ -931,84 +1611,104 @@ class MikrotikClient:
             logger.error(f"Error getting user groups: {e}")
             return []
 
-    def ensure_user_group(self, config: UserGroupConfig) -> bool:
+    def ensure_user_groups(self, configs: List[UserGroupConfig]) -> int:
+        """
+        Ensure several user groups with a single fetch of the existing ones.
+
+        Reads /user/group once and indexes the rows by name, so M configs
+        cost one read instead of M fetch-and-scan rounds.
+
+        Parameters:
+            configs (List[UserGroupConfig]): Group configurations to apply.
+
+        Returns:
+            int: Number of groups that were created or updated.
+        """
+        if not configs:
+            return 0
+        by_name = {g.get("name", ""): g for g in self.get_user_groups()}
+        return sum(
+            1
+            for config in configs
+            if self.ensure_user_group(config, _existing_index=by_name)
+        )
+
+    def ensure_user_group(
+        self, config: UserGroupConfig, _existing_index: Optional[Dict[str, Dict]] = None
+    ) -> bool:
         """
         Ensure a user group exists with the specified configuration.
 
+        Parameters:
+            config (UserGroupConfig): Desired group configuration.
+            _existing_index (Optional[Dict[str, Dict]]): Pre-fetched groups
+                keyed by name; the batch path passes this to skip the fetch.
+
         Returns:
             bool: True if changes were made, False otherwise.
         """
         try:
-            groups = self.get_user_groups()
-            existing_group = next((g for g in groups if g.get("name") == config.name), None)
-
-            # Prepare properties to set
-            properties = {
-                "policy": config.policy,
-            }
-            if config.skin:
-                properties["skin"] = config.skin
-            if config.comment:
-                properties["comment"] = config.comment
+            if _existing_index is not None:
+                existing_group = _existing_index.get(config.name)
+            else:
+                groups = self.get_user_groups()
+                existing_group = next((g for g in groups if g.get("name") == config.name), None)
 
             if existing_group:
-                # Check if update is needed
+                # Only fields that actually differ go on the wire: an
+                # identical row costs no set() round-trip and no flash write
+                properties = {}
+
                 current_policy = existing_group.get("policy", "")
-                # Normalize policies for comparison (sort them)
-                current_policies = set(p.strip() for p in current_policy.split(",") if p.strip())
-                target_policies = set(p.strip() for p in config.policy.split(",") if p.strip())
+                # Normalized once per distinct literal, then cached
+                current_policies = _normalize_csv(current_policy)
+                target_policies = _normalize_csv(config.policy)
+
+                # Requesting a policy implies dropping its negated form (e.g.
+                # adding 'ftp' removes '!ftp'), so the merge is plain set
+                # algebra instead of a per-policy add/remove loop
+                negated = frozenset(f"!{p}" for p in target_policies)
+                final_policies = (current_policies - negated) | target_policies
 
-                # Logic to merge and resolve conflicts (remove !policy if policy is requested)
-                final_policies = current_policies.copy()
-                
-                for target_p in target_policies:
-                    final_policies.add(target_p)
-                    # Remove negated version if present (e.g. remove '!ftp' if adding 'ftp')
-                    negated_p = f"!{target_p}"
-                    if negated_p in final_policies:
-                        final_policies.remove(negated_p)
-                
-                needs_update = False
                 if final_policies != current_policies:
-                    needs_update = True
                     properties["policy"] = ",".join(sorted(final_policies))
                     # Calculate what was added/changed for logging
                     added = final_policies - current_policies
                     removed = current_policies - final_policies
-                    logger.info(f"Adjusting policies for group {config.name}. Added: {added}, Removed: {removed}")
-                else:
-                    if "policy" in properties:
-                        del properties["policy"]
+                    logger.info("Adjusting policies for group %s. Added: %s, Removed: %s", config.name, added, removed)
 
                 if config.skin and existing_group.get("skin") != config.skin:
-                    needs_update = True
-                
+                    properties["skin"] = config.skin
+
                 # Check comment
                 if config.comment is not None:
                     current_comment = existing_group.get("comment", "")
                     if current_comment != config.comment:
-                        needs_update = True
                         properties["comment"] = config.comment
-                else:
-                    if "comment" in properties:
-                        del properties["comment"]
 
-                if needs_update:
-                    group_id = existing_group.get(".id") or existing_group.get("id")
-                    if not group_id:
-                        raise ValueError(f"Could not find ID for group {config.name}")
-                    
-                    logger.info(f"Updating user group {config.name} on {self.host}")
-                    self.api.get_resource("/user/group").set(id=group_id, **properties)
-                    return True
-                else:
-                    logger.info(f"User group {config.name} already correctly configured on {self.host}")
+                if not properties:
+                    logger.info("User group %s already correctly configured on %s", config.name, self.host)
                     return False
+
+                group_id = _row_id(existing_group)
+                if not group_id:
+                    raise ValueError(f"Could not find ID for group {config.name}")
+
+                logger.info("Updating user group %s on %s", config.name, self.host)
+                self._resource("/user/group").set(id=group_id, **properties)
+                return True
             else:
                 # Create new group
-                logger.info(f"Creating user group {config.name} on {self.host}")
-                properties["name"] = config.name
-                self.api.get_resource("/user/group").add(**properties)
+                logger.info("Creating user group %s on %s", config.name, self.host)
+                properties = {
+                    "name": config.name,
+                    "policy": config.policy,
+                }
+                if config.skin:
+                    properties["skin"] = config.skin
+                if config.comment:
+                    properties["comment"] = config.comment
+                self._resource("/user/group").add(**properties)
                 return True
 
         except Exception as e:
@@ -1023,84 +1723,111 @@ class MikrotikClient:
             logger.error(f"Error getting users: {e}")
             return []
 
-    def ensure_user(self, config: UserConfig) -> bool:
+    def ensure_users(self, configs: List[UserConfig]) -> int:
+        """
+        Ensure several users with a single fetch of the existing ones.
+
+        Reads /user once and indexes the rows by name, so M configs cost one
+        read instead of M fetch-and-scan rounds.
+
+        Parameters:
+            configs (List[UserConfig]): User configurations to apply.
+
+        Returns:
+            int: Number of users that were created or updated.
+        """
+        if not configs:
+            return 0
+        by_name = {u.get("name", ""): u for u in self.get_users()}
+        return sum(
+            1 for config in configs if self.ensure_user(config, _existing_index=by_name)
+        )
+
+    def ensure_user(
+        self, config: UserConfig, _existing_index: Optional[Dict[str, Dict]] = None
+    ) -> bool:
         """
         Ensure a user exists with the specified configuration.
 
+        Parameters:
+            config (UserConfig): Desired user configuration.
+            _existing_index (Optional[Dict[str, Dict]]): Pre-fetched users
+                keyed by name; the batch path passes this to skip the fetch.
+
         Returns:
             bool: True if changes were made, False otherwise.
         """
         try:
-            users = self.get_users()
-            existing_user = next((u for u in users if u.get("name") == config.name), None)
-
-            properties = {
-                "group": config.group,
-            }
-            if config.password:
-                properties["password"] = config.password
-            if config.address:
-                properties["address"] = config.address
-            if config.comment:
-                properties["comment"] = config.comment
+            if _existing_index is not None:
+                existing_user = _existing_index.get(config.name)
+            else:
+                users = self.get_users()
+                existing_user = next((u for u in users if u.get("name") == config.name), None)
 
             if existing_user:
-                # Check if update is needed
-                needs_update = False
+                # Only fields that actually differ go on the wire: an
+                # identical row costs no set() round-trip and no flash write
+                properties = {}
 
                 if existing_user.get("group") != config.group:
-                    needs_update = True
+                    properties["group"] = config.group
 
                 # Check allowed address (ACL)
                 current_address = existing_user.get("address", "")
                 target_address = config.address or ""
 
-                # Normalize addresses for comparison
-                current_addresses = set(a.strip() for a in current_address.split(",") if a.strip())
-                target_addresses = set(a.strip() for a in target_address.split(",") if a.strip())
+                # Normalize addresses for comparison (cached per literal)
+                current_addresses = _normalize_csv(current_address)
+                target_addresses = _normalize_csv(target_address)
                 
                 # Replacement logic: If target is different from current, overwrite.
                 # Note: If target is empty, it means "allow all" (remove restriction).
                 if current_addresses != target_addresses:
-                    needs_update = True
                     if target_address:
                         # Sort for consistency
                         properties["address"] = ",".join(sorted(target_addresses))
-                        logger.info(f"Updating ACLs for user {config.name}. Old: {current_address}, New: {properties['address']}")
+                        logger.info("Updating ACLs for user %s. Old: %s, New: %s", config.name, current_address, properties["address"])
                     else:
                         # If target is empty, we want to remove the address property (allow all)
                         # But 'set' command with empty string usually clears it.
-                        properties["address"] = "" 
-                        logger.info(f"Clearing ACLs for user {config.name} (Allow All)")
-                else:
-                    if "address" in properties:
-                        del properties["address"]
+                        properties["address"] = ""
+                        logger.info("Clearing ACLs for user %s (Allow All)", config.name)
 
                 # Check comment
                 if config.comment is not None:
                     current_comment = existing_user.get("comment", "")
                     if current_comment != config.comment:
-                        needs_update = True
                         properties["comment"] = config.comment
-                else:
-                     if "comment" in properties:
-                        del properties["comment"]
-
-                if needs_update:
-                    logger.info(f"Updating user {config.name} on {self.host}")
-                    user_id = existing_user.get(".id") or existing_user.get("id")
-                    if not user_id:
-                        raise ValueError(f"Could not find ID for user {config.name}")
-                    self.api.get_resource("/user").set(id=user_id, **properties)
-                    return True
-                else:
-                    logger.info(f"User {config.name} already correctly configured on {self.host}")
+
+                if not properties:
+                    logger.info("User %s already correctly configured on %s", config.name, self.host)
                     return False
+
+                # The API never returns passwords, so one can't be diffed; as
+                # before, it is (re)pushed whenever another field changes
+                if config.password:
+                    properties["password"] = config.password
+
+                logger.info("Updating user %s on %s", config.name, self.host)
+                user_id = _row_id(existing_user)
+                if not user_id:
+                    raise ValueError(f"Could not find ID for user {config.name}")
+                self._resource("/user").set(id=user_id, **properties)
+                return True
             else:
                 # Create new user
-                logger.info(f"Creating user {config.name} on {self.host}")
-                properties["name"] = config.name
-                self.api.get_resource("/user").add(**properties)
+                logger.info("Creating user %s on %s", config.name, self.host)
+                properties = {
+                    "name": config.name,
+                    "group": config.group,
+                }
+                if config.password:
+                    properties["password"] = config.password
+                if config.address:
+                    properties["address"] = config.address
+                if config.comment:
+                    properties["comment"] = config.comment
+                self._resource("/user").add(**properties)
                 return True
 
         except Exception as e:
@@ -1133,7 +1860,7 @@ class MikrotikClient:
                 logger.error(f"'remote' logging action not found on {self.host}")
                 return False
 
-            action_id = remote_action.get(".id") or remote_action.get("id")
+            action_id = _row_id(remote_action)
             if not action_id:
                 raise ValueError("Could not find ID for 'remote' logging action")
 
@@ -1161,7 +1888,7 @@ class MikrotikClient:
 
             if needs_update:
                 logger.info(f"Configuring syslog on {self.host} to send to {config.remote_server}:{config.remote_port}")
-                self.api.get_resource("/system/logging/action").set(id=action_id, **properties)
+                self._resource("/system/logging/action").set(id=action_id, **properties)
                 return True
             else:
                 logger.info(f"Syslog already correctly configured on {self.host}")
@@ -1188,8 +1915,9 @@ class MikrotikClient:
         try:
             # Get current logging rules
             logging_rules = self._execute_command("/system/logging")
-            
-            changes_made = False
+
+            # Collect all set/add commands and send them as one pipelined batch
+            pending_commands = []
 
             for topic_conf in topics_config:
                 topics = topic_conf.topics
@@ -1226,16 +1954,15 @@ class MikrotikClient:
                         updates["disabled"] = "yes" if disabled else "no"
 
                     if updates:
-                        rule_id = existing_rule.get(".id") or existing_rule.get("id")
+                        rule_id = _row_id(existing_rule)
                         if rule_id:
-                            logger.info(f"Updating logging rule for topics '{topics}' on {self.host}: {updates}")
-                            self.api.get_resource("/system/logging").set(id=rule_id, **updates)
-                            changes_made = True
+                            logger.info("Updating logging rule for topics '%s' on %s: %s", topics, self.host, updates)
+                            pending_commands.append(("/system/logging", "set", {"id": rule_id, **updates}))
                     else:
-                        logger.info(f"Logging rule for topics '{topics}' already correctly configured on {self.host}")
+                        logger.info("Logging rule for topics '%s' already correctly configured on %s", topics, self.host)
                 else:
                     # Create new rule
-                    logger.info(f"Creating logging rule for topics '{topics}' with action '{action}' on {self.host}")
+                    logger.info("Creating logging rule for topics '%s' with action '%s' on %s", topics, action, self.host)
                     properties = {
                         "topics": topics,
                         "action": action,
@@ -1243,10 +1970,13 @@ class MikrotikClient:
                     }
                     if prefix:
                         properties["prefix"] = prefix
-                    self.api.get_resource("/system/logging").add(**properties)
-                    changes_made = True
+                    pending_commands.append(("/system/logging", "add", properties))
+
+            if not pending_commands:
+                return False
 
-            return changes_made
+            results = self._pipeline(pending_commands)
+            return any(results)
 
         except Exception as e:
             logger.error(f"Error configuring logging topics on {self.host}: {e}")
@@ -1269,7 +1999,7 @@ class MikrotikClient:
 
         try:
             # Get current SNMP settings
-            snmp_resource = self.api.get_resource("/snmp")
+            snmp_resource = self._resource("/snmp")
             current_settings = snmp_resource.get()
             
             # Configure communities FIRST (before setting trap-community)
@@ -1321,10 +2051,11 @@ class MikrotikClient:
             return False
 
         try:
-            community_resource = self.api.get_resource("/snmp/community")
+            community_resource = self._resource("/snmp/community")
             existing_communities = community_resource.get()
-            
-            changes_made = False
+
+            # Collect all set/add commands and send them as one pipelined batch
+            pending_commands = []
 
             for comm_config in communities:
                 # Build properties for this community
@@ -1358,18 +2089,20 @@ class MikrotikClient:
                 
                 if existing:
                     # Update existing community
-                    community_id = existing.get(".id") or existing.get("id")
+                    community_id = _row_id(existing)
                     if community_id:
-                        logger.info(f"Updating SNMP community '{comm_config.name}' on {self.host}")
-                        community_resource.set(id=community_id, **properties)
-                        changes_made = True
+                        logger.info("Updating SNMP community '%s' on %s", comm_config.name, self.host)
+                        pending_commands.append(("/snmp/community", "set", {"id": community_id, **properties}))
                 else:
                     # Create new community
-                    logger.info(f"Creating SNMP community '{comm_config.name}' on {self.host}")
-                    community_resource.add(**properties)
-                    changes_made = True
+                    logger.info("Creating SNMP community '%s' on %s", comm_config.name, self.host)
+                    pending_commands.append(("/snmp/community", "add", properties))
+
+            if not pending_commands:
+                return False
 
-            return changes_made
+            results = self._pipeline(pending_commands)
+            return any(results)
 
         except Exception as e:
             logger.error(f"Error configuring SNMP communities on {self.host}: {e}")
@@ -5,98 +5,134 @@ This module contains Pydantic models for representing network devices,
 interfaces, neighbors, PPPoE connections, and related network entities.
 """
 
+import sys
 from datetime import datetime
-from enum import Enum
-from typing import Dict, List, Optional
+from typing import Annotated, Dict, List, Literal, Optional, Tuple
 
-from pydantic import BaseModel, Field, IPvAnyAddress
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field, PrivateAttr
 
 
-class LinkType(str, Enum):
-    """Type of network link."""
+# Bound once so each default timestamp is a plain function call instead
+# of an attribute lookup on the datetime class per constructed model
+_now = datetime.now
 
-    BACKBONE = "backbone"
-    PTP = "ptp"
-    PTMP = "ptmp"
-    PPPOE = "pppoe"
-    UNKNOWN = "unknown"
 
+def _intern(value: object) -> object:
+    return sys.intern(value) if type(value) is str else value
 
-class InterfaceType(str, Enum):
-    """Type of network interface."""
 
-    ETHER = "ether"
-    BRIDGE = "bridge"
-    WLAN = "wlan"
-    VLAN = "vlan"
-    PPPOE_CLIENT = "pppoe-client"
-    PPPOE_SERVER = "pppoe-server"
-    OTHER = "other"
+# Values that repeat across thousands of rows in a large inventory
+# (interface names, types, severities). Interning at the validation
+# boundary collapses the duplicates into one shared string object.
+InternedStr = Annotated[str, BeforeValidator(_intern)]
 
 
-class IPAddress(BaseModel):
-    """Represents an IP address configuration on an interface."""
+class _ModelBase(BaseModel):
+    """Shared configuration for every inventory model.
 
-    address: str = Field(..., description="IP address with CIDR notation")
-    network: str = Field(..., description="Network address")
-    interface: str = Field(..., description="Interface name")
-    disabled: bool = Field(default=False, description="Whether the IP is disabled")
-    comment: Optional[str] = Field(None, description="Optional comment")
+    extra="forbid" makes a misspelled key fail loudly at the validated
+    load boundary instead of being silently dropped. frozen is left off:
+    wireless details are attached to Interface after construction.
+    """
 
+    model_config = ConfigDict(extra="forbid")
 
-class Neighbor(BaseModel):
-    """Represents a network neighbor discovered via LLDP or similar."""
 
-    interface: str = Field(..., description="Local interface name")
-    identity: str = Field(..., description="Remote device identity")
-    address: Optional[str] = Field(None, description="Remote device address")
-    platform: Optional[str] = Field(None, description="Remote device platform")
-    version: Optional[str] = Field(None, description="Remote device version")
-    mac_address: Optional[str] = Field(None, description="Remote device MAC address")
+# Link and interface types. Literal compiles to a static membership
+# check in pydantic-core, where the previous str Enums dispatched
+# through a Python-level member lookup per validated Link. The module
+# constants below replace the former enum members at call sites.
+LinkType = Literal["backbone", "ptp", "ptmp", "pppoe", "unknown"]
 
+LINK_BACKBONE: LinkType = "backbone"
+LINK_PTP: LinkType = "ptp"
+LINK_PTMP: LinkType = "ptmp"
+LINK_PPPOE: LinkType = "pppoe"
+LINK_UNKNOWN: LinkType = "unknown"
 
-class PPPoEActive(BaseModel):
-    """Represents an active PPPoE connection."""
+InterfaceType = Literal[
+    "ether", "bridge", "wlan", "vlan", "pppoe-client", "pppoe-server", "other"
+]
 
-    name: str = Field(..., description="Connection name")
-    service: Optional[str] = Field(None, description="Service name")
-    caller_id: str = Field(..., description="Client MAC address")
-    address: str = Field(..., description="Assigned IP address")
-    uptime: str = Field(..., description="Connection uptime")
-    encoding: Optional[str] = Field(None, description="Encoding information")
 
+class IPAddress(_ModelBase):
+    """Represents an IP address configuration on an interface.
 
-class PPPoESecret(BaseModel):
-    """Represents a PPPoE secret (client credentials)."""
+    address carries CIDR notation; network is the derived network address.
+    """
 
-    name: str = Field(..., description="Username")
-    password: Optional[str] = Field(None, description="Password (if readable)")
-    service: Optional[str] = Field(None, description="Service name")
-    profile: str = Field(..., description="Profile name")
-    local_address: Optional[str] = Field(None, description="Local (server) IP")
-    remote_address: Optional[str] = Field(None, description="Remote (client) IP")
-    disabled: bool = Field(default=False, description="Whether the secret is disabled")
-    comment: Optional[str] = Field(None, description="Optional comment")
+    address: str
+    network: str
+    interface: InternedStr
+    disabled: bool = False
+    comment: Optional[str] = None
+
+
+class Neighbor(_ModelBase):
+    """Represents a network neighbor discovered via LLDP or similar.
+
+    interface is the local side; the remaining fields describe the remote
+    device as reported by discovery.
+    """
+
+    interface: InternedStr
+    identity: str
+    address: Optional[str] = None
+    platform: Optional[InternedStr] = None
+    version: Optional[str] = None
+    mac_address: Optional[str] = None
+
+
+class PPPoEActive(_ModelBase):
+    """Represents an active PPPoE connection.
+
+    caller_id is the client MAC address and address the assigned IP.
+    """
+
+    name: str
+    service: Optional[str] = None
+    caller_id: str
+    address: str
+    uptime: str
+    encoding: Optional[str] = None
 
 
-class Interface(BaseModel):
+class PPPoESecret(_ModelBase):
+    """Represents a PPPoE secret (client credentials).
+
+    name is the username; local_address/remote_address are the server and
+    client IPs. password is only set when readable on the router.
+    """
+
+    name: str
+    password: Optional[str] = None
+    service: Optional[str] = None
+    profile: str
+    local_address: Optional[str] = None
+    remote_address: Optional[str] = None
+    disabled: bool = False
+    comment: Optional[str] = None
+
+
+class Interface(_ModelBase):
     """Represents a network interface."""
 
-    name: str = Field(..., description="Interface name")
-    type: str = Field(..., description="Interface type")
-    mtu: Optional[int] = Field(None, description="Maximum transmission unit")
-    mac_address: Optional[str] = Field(None, description="MAC address")
-    disabled: bool = Field(default=False, description="Whether the interface is disabled")
-    running: bool = Field(default=False, description="Whether the interface is running")
-    comment: Optional[str] = Field(None, description="Optional comment")
+    name: InternedStr
+    type: InternedStr
+    mtu: Optional[int] = None
+    mac_address: Optional[str] = None
+    disabled: bool = False
+    running: bool = False
+    comment: Optional[str] = None
 
-    # Additional fields for wireless interfaces
-    ssid: Optional[str] = Field(None, description="SSID for wireless interfaces")
-    mode: Optional[str] = Field(None, description="Mode (ap-bridge, station, etc.)")
-    frequency: Optional[str] = Field(None, description="Operating frequency")
+    # Additional fields for wireless interfaces: SSID, mode
+    # (ap-bridge, station, etc.) and operating frequency
+    ssid: Optional[str] = None
+    mode: Optional[str] = None
+    frequency: Optional[str] = None
 
 
-class SystemResource(BaseModel):
+class SystemResource(_ModelBase):
     """Represents system resources and information."""
 
     uptime: str = Field(..., description="System uptime")
@@ -109,23 +145,35 @@ class SystemResource(BaseModel):
     board_name: Optional[str] = Field(None, description="Board name")
 
 
-class Scheduler(BaseModel):
-    """Represents a system scheduler on a Mikrotik router."""
+class Scheduler(_ModelBase):
+    """Represents a system scheduler on a Mikrotik router.
+
+    on_event holds the script/commands to execute; interval and
+    start_date/start_time control when.
+    """
 
-    name: str = Field(..., description="Scheduler name")
-    start_date: Optional[str] = Field(None, description="Start date")
-    start_time: Optional[str] = Field(None, description="Start time")
-    interval: Optional[str] = Field(None, description="Execution interval")
-    on_event: Optional[str] = Field(None, description="Script/commands to execute")
-    policy: Optional[str] = Field(None, description="Policy settings")
-    disabled: bool = Field(default=False, description="Whether the scheduler is disabled")
-    run_count: Optional[int] = Field(None, description="Number of times executed")
-    next_run: Optional[str] = Field(None, description="Next scheduled run time")
+    name: str
+    start_date: Optional[str] = None
+    start_time: Optional[str] = None
+    interval: Optional[str] = None
+    on_event: Optional[str] = None
+    policy: Optional[str] = None
+    disabled: bool = False
+    run_count: Optional[int] = None
+    next_run: Optional[str] = None
 
 
 
-class Router(BaseModel):
-    """Represents a Mikrotik router with all its collected information."""
+class Router(_ModelBase):
+    """Represents a Mikrotik router with all its collected information.
+
+    Routers are write-once: every collection is passed to the constructor
+    at scrape time and never mutated afterwards, so the model is frozen
+    and the append-only collections are stored as tuples, which skips the
+    mutable-copy semantics of list validation.
+    """
+
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     ip_address: str = Field(..., description="Management IP address")
     identity: str = Field(..., description="Router identity/hostname")
@@ -135,26 +183,37 @@ class Router(BaseModel):
     interfaces: List[Interface] = Field(default_factory=list, description="Network interfaces")
     ip_addresses: List[IPAddress] = Field(default_factory=list, description="IP addresses")
     neighbors: List[Neighbor] = Field(default_factory=list, description="Network neighbors")
-    pppoe_active: List[PPPoEActive] = Field(
-        default_factory=list, description="Active PPPoE connections"
+    pppoe_active: Tuple[PPPoEActive, ...] = Field(
+        default=(), description="Active PPPoE connections"
     )
-    pppoe_secrets: List[PPPoESecret] = Field(default_factory=list, description="PPPoE secrets")
-    schedulers: List[Scheduler] = Field(default_factory=list, description="System schedulers")
+    pppoe_secrets: Tuple[PPPoESecret, ...] = Field(default=(), description="PPPoE secrets")
+    schedulers: Tuple[Scheduler, ...] = Field(default=(), description="System schedulers")
 
 
     # Metadata
     last_updated: datetime = Field(
-        default_factory=datetime.now, description="Last update timestamp"
+        default_factory=_now, description="Last update timestamp"
     )
     connection_successful: bool = Field(default=True, description="Connection status")
     connection_error: Optional[str] = Field(None, description="Connection error message")
 
+    # Lazily built name index; analysis passes look interfaces up once
+    # per neighbor, which was an O(n) list scan each time
+    _interfaces_by_name: Optional[Dict[str, "Interface"]] = PrivateAttr(default=None)
+
+    def find_interface(self, name: str) -> Optional["Interface"]:
+        """Return the interface with the given name, or None if absent."""
+        index = self._interfaces_by_name
+        if index is None:
+            index = self._interfaces_by_name = {i.name: i for i in self.interfaces}
+        return index.get(name)
+
 
-class Link(BaseModel):
+class Link(_ModelBase):
     """Represents a network link between two devices."""
 
     source_router: str = Field(..., description="Source router IP or identity")
-    source_interface: str = Field(..., description="Source interface name")
+    source_interface: InternedStr = Field(..., description="Source interface name")
     destination_router: str = Field(..., description="Destination router IP or identity")
     destination_interface: Optional[str] = Field(None, description="Destination interface name")
     link_type: LinkType = Field(..., description="Type of link")
@@ -164,18 +223,18 @@ class Link(BaseModel):
     notes: Optional[str] = Field(None, description="Additional notes or observations")
 
 
-class Anomaly(BaseModel):
+class Anomaly(_ModelBase):
     """Represents a detected anomaly or configuration issue."""
 
     router: str = Field(..., description="Router IP or identity")
     anomaly_type: str = Field(..., description="Type of anomaly")
-    severity: str = Field(..., description="Severity level (info, warning, critical)")
+    severity: InternedStr = Field(..., description="Severity level (info, warning, critical)")
     description: str = Field(..., description="Detailed description")
     affected_object: Optional[str] = Field(None, description="Affected object (interface, etc.)")
     suggestion: Optional[str] = Field(None, description="Suggested remediation")
 
 
-class IPService(BaseModel):
+class IPService(_ModelBase):
     """Represents an IP service configuration on a Mikrotik router."""
 
     name: str = Field(..., description="Service name (api, ssh, www, etc.)")
@@ -185,24 +244,24 @@ class IPService(BaseModel):
     certificate: Optional[str] = Field(None, description="Certificate name (for HTTPS services)")
 
 
-class IPServiceConfig(BaseModel):
+class IPServiceConfig(_ModelBase):
     """Represents IP service configuration to apply to a router."""
 
     service_name: str = Field(..., description="Service name to configure")
     addresses: str = Field(..., description="Comma-separated list of allowed IP addresses/networks")
 
 
-class IPServiceRollbackInfo(BaseModel):
+class IPServiceRollbackInfo(_ModelBase):
     """Stores rollback information for IP service configuration."""
 
     router_ip: str = Field(..., description="Router IP address")
     scheduler_name: str = Field(..., description="Name of the rollback scheduler created")
     original_config: Dict[str, str] = Field(..., description="Original IP service configuration")
-    applied_at: datetime = Field(default_factory=datetime.now, description="When configuration was applied")
+    applied_at: datetime = Field(default_factory=_now, description="When configuration was applied")
     rollback_timeout: int = Field(default=300, description="Rollback timeout in seconds")
 
 
-class UserGroupConfig(BaseModel):
+class UserGroupConfig(_ModelBase):
     """Represents a RouterOS user group configuration."""
 
     name: str = Field(..., description="Group name")
@@ -211,7 +270,7 @@ class UserGroupConfig(BaseModel):
     comment: Optional[str] = Field(None, description="Comment")
 
 
-class UserConfig(BaseModel):
+class UserConfig(_ModelBase):
     """Represents a RouterOS user configuration."""
 
     name: str = Field(..., description="Username")
@@ -221,7 +280,7 @@ class UserConfig(BaseModel):
     comment: Optional[str] = Field(None, description="Comment")
 
 
-class SyslogConfig(BaseModel):
+class SyslogConfig(_ModelBase):
     """Represents syslog remote action configuration."""
 
     remote_server: str = Field(..., description="Remote syslog server IP/hostname")
@@ -231,7 +290,7 @@ class SyslogConfig(BaseModel):
     syslog_severity: str = Field(default="auto", description="Syslog severity (auto, debug, info, etc.)")
 
 
-class LoggingTopicConfig(BaseModel):
+class LoggingTopicConfig(_ModelBase):
     """Represents a logging topic configuration."""
 
     topics: str = Field(..., description="Comma-separated list of topics (e.g., 'info,warning,error')")
@@ -240,7 +299,7 @@ class LoggingTopicConfig(BaseModel):
     disabled: bool = Field(default=False, description="Whether the logging rule is disabled")
 
 
-class SNMPCommunityConfig(BaseModel):
+class SNMPCommunityConfig(_ModelBase):
     """Represents an SNMP community configuration."""
 
     name: str = Field(..., description="Community name")
@@ -254,7 +313,7 @@ class SNMPCommunityConfig(BaseModel):
     encryption_password: Optional[str] = Field(None, description="Encryption password")
 
 
-class SNMPConfig(BaseModel):
+class SNMPConfig(_ModelBase):
     """Represents SNMP general configuration."""
 
     enabled: bool = Field(default=True, description="Enable/disable SNMP")
@@ -265,14 +324,14 @@ class SNMPConfig(BaseModel):
     communities: List[SNMPCommunityConfig] = Field(default_factory=list, description="SNMP communities")
 
 
-class NetworkInventory(BaseModel):
+class NetworkInventory(_ModelBase):
     """Complete network inventory with routers, links, and anomalies."""
 
     routers: List[Router] = Field(default_factory=list, description="All routers in inventory")
     links: List[Link] = Field(default_factory=list, description="Detected network links")
     anomalies: List[Anomaly] = Field(default_factory=list, description="Detected anomalies")
     generated_at: datetime = Field(
-        default_factory=datetime.now, description="Inventory generation timestamp"
+        default_factory=_now, description="Inventory generation timestamp"
     )
     stats: Dict[str, int] = Field(
         default_factory=dict, description="Statistics about the inventory"
@@ -6,14 +6,25 @@ backup files from Mikrotik routers using SSH/SFTP protocol.
 """
 
 import logging
+import select
+import threading
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 import paramiko
 from paramiko import SSHClient, AutoAddPolicy, SFTPClient
 
 logger = logging.getLogger(__name__)
 
+# Warm SSH connections kept across SFTPClientManager instances, keyed by
+# (host, port, username). The SSH handshake (key exchange plus auth) costs
+# hundreds of milliseconds per router, and the scraper opens a session per
+# backup step; reusing the transport amortizes that cost
+_SSH_POOL: Dict[Tuple[str, int, str], SSHClient] = {}
+_SSH_POOL_LOCK = threading.Lock()
+_SSH_POOL_MAX = 32
+
 
 class SFTPClientManager:
     """
@@ -48,6 +59,10 @@ class SFTPClientManager:
         self.timeout = timeout
         self.ssh_client: Optional[SSHClient] = None
         self.sftp_client: Optional[SFTPClient] = None
+        # Remote directories already confirmed to exist; batch uploads
+        # into the same tree re-stat every parent otherwise, at one
+        # round-trip apiece
+        self._remote_dir_cache: set = set()
 
     def connect(self) -> bool:
         """
@@ -56,6 +71,28 @@ class SFTPClientManager:
         Returns:
             bool: True if connection successful, False otherwise.
         """
+        # Reuse a warm, already-authenticated SSH connection when one is
+        # pooled for this router; a pooled transport may have died while
+        # idle, so fall back to a fresh connect if it no longer works
+        pool_key = (self.host, self.port, self.username)
+        with _SSH_POOL_LOCK:
+            pooled = _SSH_POOL.pop(pool_key, None)
+        if pooled is not None:
+            transport = pooled.get_transport()
+            if transport is not None and transport.is_active():
+                try:
+                    self.sftp_client = pooled.open_sftp()
+                    self.ssh_client = pooled
+                    self._remote_dir_cache.clear()
+                    logger.info(f"Reusing SSH connection to {self.host}")
+                    return True
+                except Exception as e:
+                    logger.debug(f"Pooled SSH connection to {self.host} unusable: {e}")
+            try:
+                pooled.close()
+            except Exception:
+                pass
+
         try:
             logger.info(f"Connecting to {self.host}:{self.port} via SFTP...")
 
@@ -74,8 +111,15 @@ class SFTPClientManager:
                 look_for_keys=False,
             )
 
+            # Keepalive lets a pooled transport detect a dead peer while
+            # idle instead of failing on the next reuse
+            transport = self.ssh_client.get_transport()
+            if transport is not None:
+                transport.set_keepalive(30)
+
             # Open SFTP session
             self.sftp_client = self.ssh_client.open_sftp()
+            self._remote_dir_cache.clear()
 
             logger.info(f"Successfully connected to {self.host} via SFTP")
             return True
@@ -94,18 +138,44 @@ class SFTPClientManager:
             return False
 
     def disconnect(self) -> None:
-        """Close the SFTP and SSH connections."""
+        """Return the SSH connection to the pool, or close it if the pool is full."""
         try:
             if self.sftp_client:
                 self.sftp_client.close()
                 self.sftp_client = None
             if self.ssh_client:
-                self.ssh_client.close()
+                pool_key = (self.host, self.port, self.username)
+                transport = self.ssh_client.get_transport()
+                pooled = False
+                if transport is not None and transport.is_active():
+                    with _SSH_POOL_LOCK:
+                        if pool_key not in _SSH_POOL and len(_SSH_POOL) < _SSH_POOL_MAX:
+                            _SSH_POOL[pool_key] = self.ssh_client
+                            pooled = True
+                if pooled:
+                    logger.info(f"Returned SSH connection to {self.host} to the pool")
+                else:
+                    self.ssh_client.close()
+                    logger.info(f"Disconnected from {self.host}")
                 self.ssh_client = None
-            logger.info(f"Disconnected from {self.host}")
+            self._remote_dir_cache.clear()
         except Exception as e:
             logger.warning(f"Error disconnecting from {self.host}: {e}")
 
+    @classmethod
+    def close_all(cls) -> None:
+        """Close every pooled warm SSH connection; call once at process shutdown."""
+        with _SSH_POOL_LOCK:
+            pooled = list(_SSH_POOL.values())
+            _SSH_POOL.clear()
+        for ssh_client in pooled:
+            try:
+                ssh_client.close()
+            except Exception as e:
+                logger.warning(f"Error closing pooled SSH connection: {e}")
+        if pooled:
+            logger.info(f"Closed {len(pooled)} pooled SSH connections")
+
     def execute_command(self, command: str, timeout: int = 30) -> tuple[bool, str, str]:
         """
         Execute a command on the router via SSH.
@@ -124,11 +194,35 @@ class SFTPClientManager:
         try:
             logger.info(f"Executing command on {self.host}: {command}")
             stdin, stdout, stderr = self.ssh_client.exec_command(command, timeout=timeout)
-            
-            stdout_text = stdout.read().decode('utf-8')
-            stderr_text = stderr.read().decode('utf-8')
-            exit_status = stdout.channel.recv_exit_status()
-            
+
+            # Drain stdout and stderr together instead of two sequential
+            # read() calls: a command filling the stderr window while we
+            # block on stdout would stall the channel on flow control
+            channel = stdout.channel
+            stdout_buf = bytearray()
+            stderr_buf = bytearray()
+            deadline = time.monotonic() + timeout
+            while True:
+                drained = False
+                while channel.recv_ready():
+                    stdout_buf += channel.recv(65536)
+                    drained = True
+                while channel.recv_stderr_ready():
+                    stderr_buf += channel.recv_stderr(65536)
+                    drained = True
+                if channel.exit_status_ready() and not drained:
+                    break
+                if not drained:
+                    if time.monotonic() > deadline:
+                        channel.close()
+                        logger.error(f"Command timed out on {self.host}: {command}")
+                        return False, bytes(stdout_buf).decode("utf-8", "replace"), "timeout"
+                    select.select([channel], [], [], 0.1)
+
+            stdout_text = bytes(stdout_buf).decode("utf-8", "replace")
+            stderr_text = bytes(stderr_buf).decode("utf-8", "replace")
+            exit_status = channel.recv_exit_status()
+
             if exit_status == 0:
                 logger.info(f"Command executed successfully on {self.host}")
                 return True, stdout_text, stderr_text
@@ -266,10 +360,14 @@ class SFTPClientManager:
         if not self.sftp_client:
             return
 
+        if remote_path in self._remote_dir_cache:
+            return
+
         try:
             # Check if path exists
             try:
                 self.sftp_client.stat(remote_path)
+                self._remote_dir_cache.add(remote_path)
                 return  # Path already exists
             except IOError:
                 pass  # Path doesn't exist, create it
@@ -284,12 +382,18 @@ class SFTPClientManager:
                     continue
                 current_path = str(Path(current_path) / part)
 
+                if current_path in self._remote_dir_cache:
+                    continue
+
                 # Try to create directory
                 try:
                     self.sftp_client.mkdir(current_path)
                     logger.debug(f"Created remote directory: {current_path}")
                 except IOError:
                     pass  # Directory might already exist
+                self._remote_dir_cache.add(current_path)
+
+            self._remote_dir_cache.add(remote_path)
 
         except Exception as e:
             logger.warning(f"Error creating remote directories: {e}")
@@ -13,7 +13,7 @@ from src.models import (
     PPPoESecret,
     SystemResource,
     Link,
-    LinkType,
+    LINK_BACKBONE,
     Anomaly,
     NetworkInventory,
 )
@@ -65,10 +65,10 @@ def test_link_creation():
         source_interface="ether1",
         destination_router="router-02",
         destination_interface="ether1",
-        link_type=LinkType.BACKBONE,
+        link_type=LINK_BACKBONE,
     )
     assert link.source_router == "router-01"
-    assert link.link_type == LinkType.BACKBONE
+    assert link.link_type == LINK_BACKBONE
     assert link.confidence == 1.0
 
 
@@ -93,7 +93,7 @@ def test_network_inventory_creation():
         source_router="router-01",
         source_interface="ether1",
         destination_router="router-02",
-        link_type=LinkType.BACKBONE,
+        link_type=LINK_BACKBONE,
     )
     
     inventory = NetworkInventory(
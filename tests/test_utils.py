@@ -0,0 +1,37 @@
+"""
+Unit tests for the Mikrotik inventory system utility functions.
+"""
+
+from src.utils import is_valid_ip
+
+
+def test_is_valid_ip_ipv4():
+    """Test IPv4 validation."""
+    assert is_valid_ip("192.168.1.1") is True
+    assert is_valid_ip("0.0.0.0") is True
+    assert is_valid_ip("255.255.255.255") is True
+    assert is_valid_ip("256.1.1.1") is False
+    assert is_valid_ip("01.2.3.4") is False
+    assert is_valid_ip("1.2.3") is False
+    assert is_valid_ip("1.2.3.4.5") is False
+    assert is_valid_ip("not-an-ip") is False
+    assert is_valid_ip("") is False
+
+
+def test_is_valid_ip_ipv6():
+    """Test IPv6 validation."""
+    assert is_valid_ip("::1") is True
+    assert is_valid_ip("fe80::1") is True
+    assert is_valid_ip("2001:db8::ff00:42:8329") is True
+    assert is_valid_ip("gg::1") is False
+
+
+def test_is_valid_ip_ipv6_with_embedded_dotted_quad():
+    """Test IPv6 forms carrying an embedded IPv4 dotted quad.
+
+    Regression test: these contain three dots, so they must not be
+    swallowed by the IPv4 fast path.
+    """
+    assert is_valid_ip("::ffff:192.168.1.1") is True
+    assert is_valid_ip("64:ff9b::1.2.3.4") is True
+    assert is_valid_ip("::ffff:999.168.1.1") is False
@@ -7,15 +7,16 @@ from typing import List, Dict, Optional
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("test")
 
-# Mock Models
-@dataclass
+# Mock Models: slots drop the per-instance __dict__ and eq=False skips
+# the generated __eq__/__hash__; configs are passed around by identity
+@dataclass(slots=True, eq=False)
 class UserGroupConfig:
     name: str
     policy: str
     skin: str = "default"
     comment: str = None
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class UserConfig:
     name: str
     group: str
@@ -36,18 +37,16 @@ class MockClient:
 
     def set(self, id, **kwargs):
         logger.info(f"SET called on {id} with {kwargs}")
-        if "policy" in kwargs:
-             # Update mock group policy for verification
-             for g in self.mock_groups:
-                 if g[".id"] == id:
-                     g["policy"] = kwargs["policy"]
-        if "comment" in kwargs:
-             for g in self.mock_groups:
-                 if g[".id"] == id:
-                     g["comment"] = kwargs["comment"]
-             for u in self.mock_users:
-                 if u[".id"] == id:
-                     u["comment"] = kwargs["comment"]
+        # Single scan for the matching row instead of one pass per
+        # property; ids are unique across both mock tables
+        for row in self.mock_groups:
+            if row[".id"] == id:
+                row.update(kwargs)
+                return
+        for row in self.mock_users:
+            if row[".id"] == id:
+                row.update(kwargs)
+                return
 
     def add(self, **kwargs):
         logger.info(f"ADD called with {kwargs}")
@@ -58,57 +57,39 @@ class MockClient:
 
     def ensure_user_group(self, config: UserGroupConfig) -> bool:
         existing_group = next((g for g in self.mock_groups if g.get("name") == config.name), None)
-        
-        properties = {
-            "policy": config.policy,
-        }
-        if config.skin:
-            properties["skin"] = config.skin
-        if config.comment:
-            properties["comment"] = config.comment
 
         if existing_group:
-            # Check if update is needed
+            # Build only the fields that actually changed instead of seeding
+            # a full dict and deleting unchanged keys again (mirrors
+            # MikrotikClient)
+            properties = {}
+
             current_policy = existing_group.get("policy", "")
-            # Normalize policies for comparison (sort them)
-            current_policies = set(p.strip() for p in current_policy.split(",") if p.strip())
-            target_policies = set(p.strip() for p in config.policy.split(",") if p.strip())
-
-            # Logic to merge and resolve conflicts (remove !policy if policy is requested)
-            final_policies = current_policies.copy()
-            
-            for target_p in target_policies:
-                final_policies.add(target_p)
-                # Remove negated version if present (e.g. remove '!ftp' if adding 'ftp')
-                negated_p = f"!{target_p}"
-                if negated_p in final_policies:
-                    final_policies.remove(negated_p)
-            
-            needs_update = False
+            # Normalize policies in one pass per string: the generator
+            # version called strip() twice per token (mirrors MikrotikClient)
+            current_policies = set(filter(None, map(str.strip, current_policy.split(","))))
+            target_policies = set(filter(None, map(str.strip, config.policy.split(","))))
+
+            # Logic to merge and resolve conflicts: requesting a policy drops
+            # its negated form (e.g. adding 'ftp' removes '!ftp'), so the
+            # merge is plain set algebra (mirrors MikrotikClient)
+            negated = {f"!{p}" for p in target_policies}
+            final_policies = (current_policies - negated) | target_policies
+
             if final_policies != current_policies:
-                needs_update = True
                 properties["policy"] = ",".join(sorted(final_policies))
                 added = final_policies - current_policies
                 removed = current_policies - final_policies
                 logger.info(f"Adjusting policies for group {config.name}. Added: {added}, Removed: {removed}")
-            else:
-                if "policy" in properties:
-                    del properties["policy"]
 
             if config.skin and existing_group.get("skin") != config.skin:
-                needs_update = True
-            
+                properties["skin"] = config.skin
+
             # Check comment
-            if config.comment is not None:
-                current_comment = existing_group.get("comment", "")
-                if current_comment != config.comment:
-                    needs_update = True
-                    properties["comment"] = config.comment
-            else:
-                if "comment" in properties:
-                    del properties["comment"]
+            if config.comment is not None and existing_group.get("comment", "") != config.comment:
+                properties["comment"] = config.comment
 
-            if needs_update:
+            if properties:
                 group_id = existing_group.get(".id") or existing_group.get("id")
                 logger.info(f"Updating user group {config.name} on {self.host}")
                 self.api.get_resource("/user/group").set(id=group_id, **properties)